@@ -6,16 +6,26 @@ extracts key information (industries, countries, attack methods),
 and visualizes the data using matplotlib.
 """
 
+import os
 import time
 import re
+import copy
+import tempfile
+import queue
+import threading
 import json
 import csv
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Set, Optional, Tuple
+from functools import lru_cache, cached_property
+from itertools import islice
+from typing import List, Dict, Set, Optional, Tuple, Iterator, Iterable
 from collections import defaultdict, Counter
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
+from types import MappingProxyType
 from urllib.parse import urlencode
 
 from selenium import webdriver
@@ -23,7 +33,32 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+
+try:
+    import ahocorasick
+except ImportError:  # Optional C accelerator; keyword scans fall back to plain substring tests
+    ahocorasick = None
+
+try:
+    from dateutil.parser import parse as _DATEUTIL_PARSE
+except ImportError:  # Dates are parsed with the regex patterns only
+    _DATEUTIL_PARSE = None
+
+try:
+    import orjson
+except ImportError:  # Results are read and written with the standard json module
+    orjson = None
+
+try:
+    import requests
+except ImportError:  # Articles are always loaded in the browser
+    requests = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # Article pages are queried in the browser instead of parsed in-process
+    HTMLParser = None
 
 # Configure logging
 logging.basicConfig(
@@ -33,10 +68,325 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are only written to files, never shown
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
-@dataclass
+# Resolution of the individual charts; the combined dashboard is the published artifact and keeps 300
+_FIG_DPI = 150
+_DASHBOARD_DPI = 300
+
+# Relative dates shown by Google ("3 days ago", "yesterday", "today")
+_REL_DATE_RE = re.compile(r'(?:(\d+)\s+(day|week|month|year)s?\s+ago)|(yesterday)|(today)')
+# Days per relative date unit
+_UNIT = {'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+# Fills in missing date parts for dateutil (e.g. "March 2021" -> 2021-03-01)
+_DEFAULT_DT = datetime(2020, 1, 1)
+
+# Month names and abbreviations to zero-padded month numbers
+_MONTHS = {
+    'jan': '01', 'january': '01', 'feb': '02', 'february': '02',
+    'mar': '03', 'march': '03', 'apr': '04', 'april': '04',
+    'may': '05', 'jun': '06', 'june': '06', 'jul': '07', 'july': '07',
+    'aug': '08', 'august': '08', 'sep': '09', 'sept': '09', 'september': '09',
+    'oct': '10', 'october': '10', 'nov': '11', 'november': '11',
+    'dec': '12', 'december': '12'
+}
+
+
+def _format_month_day_year(month_name: str, day: str, year: str, months: Dict[str, str] = _MONTHS) -> Optional[str]:
+    """Format date from (month name, day, year) parts."""
+    month = months.get(month_name.lower())
+    if month:
+        return f"{year}-{month}-{day.zfill(2)}"
+    return None
+
+
+def _format_day_month_year(day: str, month_name: str, year: str, months: Dict[str, str] = _MONTHS) -> Optional[str]:
+    """Format date from (day, month name, year) parts."""
+    return _format_month_day_year(month_name, day, year, months)
+
+
+def _format_year_month_day(year: str, month: str, day: str) -> str:
+    """Format date from numeric (year, month, day) parts."""
+    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+
+
+def _try_eu_or_us_format(day: str, month: str, year: str) -> str:
+    """Try both EU (DD/MM/YYYY) and US (MM/DD/YYYY) formats."""
+    # If first number > 12, it's likely EU format (day)
+    if int(day) > 12:
+        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    # Otherwise try US format
+    elif int(month) > 12:
+        return f"{year}-{day.zfill(2)}-{month.zfill(2)}"
+    else:
+        # Ambiguous - prefer US format
+        return f"{year}-{day.zfill(2)}-{month.zfill(2)}"
+
+
+def _format_month_year(month_name: str, year: str, months: Dict[str, str] = _MONTHS) -> Optional[str]:
+    """Format month and year only (use first day of month)."""
+    month = months.get(month_name.lower())
+    if month:
+        return f"{year}-{month}-01"
+    return None
+
+
+# Google's Terms and Conditions / cookie consent "I agree" / "Accept" button, as one
+# XPath so a single wait covers every variant. Kept to the predicates Google uses:
+# the wait resolves to the first match in document order, so broad catch-alls
+# (e.g. any hidden .accept button earlier on the page) would make it time out
+_CONSENT_XPATH = (
+    "//button[contains(text(), 'I agree') or contains(text(), 'Accept')"
+    " or @id='L2AGLb' or contains(@aria-label, 'Accept')]"
+)
+
+
+# Collects all search results on a Google page in one WebDriver round-trip.
+# Returns [{title, url, snippet, dates}], with candidate date texts in document order.
+_SEARCH_RESULTS_JS = """
+    function text(el) { return el ? (el.innerText || '').trim() : ''; }
+    
+    // Google uses various result containers, take the first selector that matches
+    var containerSelectors = ['div.g', 'div[data-ved]', 'div.tF2Cxc'];
+    var results = [];
+    for (var i = 0; i < containerSelectors.length && !results.length; i++) {
+        results = Array.from(document.querySelectorAll(containerSelectors[i]));
+    }
+    if (!results.length) {
+        // Fallback: any div with an h3 and a link
+        results = Array.from(document.querySelectorAll('div')).filter(function(div) {
+            return div.querySelector('h3') && div.querySelector('a[href]');
+        });
+    }
+    
+    // Fallback selector lists joined into single queries
+    var snippetSelector = 'div.VwiC3b, span.st, div.s, .IsZvec';
+    var dateSelector = [
+        'span.f', 'span.fG8Fp', '.fG8Fp', "span[style*='color']", '.f',
+        'span.LEwnzc', 'span.fG8Fp.LEwnzc', 'div.fG8Fp', "span[class*='f']"
+    ].join(', ');
+    
+    return results.map(function(result) {
+        var link = result.querySelector('a[href]');
+        var dates = [];
+        result.querySelectorAll(dateSelector).forEach(function(el) {
+            var dateText = text(el);
+            if (dateText && dates.indexOf(dateText) < 0) dates.push(dateText);
+        });
+        return {
+            title: text(result.querySelector('h3')),
+            url: link ? link.href : '',
+            snippet: text(result.querySelector(snippetSelector)),
+            dates: dates
+        };
+    });
+"""
+
+# Main content selectors for article pages, in order of preference
+_CONTENT_SELECTORS = [
+    'article',
+    'main',
+    '[role="main"]',
+    '.article-content',
+    '.post-content',
+    '.entry-content',
+    '.article-body',
+    '.post-body',
+    '#content',
+    '.content',
+    'div[class*="article"]:not(.article-footer):not(.article-tags)',
+    'div[class*="content"]:not(.content-footer):not(.content-tags)',
+    'div[class*="post"]:not(.post-footer):not(.post-tags)',
+]
+
+# Non-content elements removed from article pages before extracting text
+_NON_CONTENT_SELECTOR = (
+    'footer, nav, aside, header, .footer, .nav, .sidebar, .tags, .tag, .related, '
+    '.share, .social, .comments, .author-box, .newsletter'
+)
+
+# Parsed HTML (static or page_source) also carries script/style text that innerText would skip
+_STATIC_NON_CONTENT_SELECTOR = _NON_CONTENT_SELECTOR + ', script, style, noscript, template'
+# Block-level elements that innerText puts on lines of their own
+_BLOCK_SELECTOR = (
+    'address, article, aside, blockquote, dd, details, div, dl, dt, fieldset, figcaption, figure, '
+    'footer, form, h1, h2, h3, h4, h5, h6, header, hr, li, main, nav, ol, p, pre, section, '
+    'summary, table, tr, ul'
+)
+# Line break marker inserted into parsed pages; not whitespace, so it survives whitespace collapsing
+_LINE_BREAK = '\ue000'
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Removes the elements matching arguments[1] from an article page, then collects every
+# element matching any of the selectors in arguments[0] in one WebDriver round-trip.
+# Returns [{text, className, id, linkCount, selectors}], where selectors lists the
+# indices of the selectors the element matches.
+_CONTENT_CANDIDATES_JS = """
+    try {
+        document.querySelectorAll(arguments[1]).forEach(function(el) { el.remove(); });
+    } catch (e) {}
+    
+    var selectors = arguments[0];
+    return Array.from(document.querySelectorAll(selectors.join(', '))).map(function(el) {
+        var matched = [];
+        selectors.forEach(function(sel, i) { if (el.matches(sel)) matched.push(i); });
+        return {
+            text: el.innerText || '',
+            className: el.getAttribute('class') || '',
+            id: el.id || '',
+            linkCount: el.getElementsByTagName('a').length,
+            selectors: matched
+        };
+    });
+"""
+
+# Browser-like User-Agent for plain HTTP article fetches
+_HTTP_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+)
+
+# Meta tags that may hold an article's publication date, in order of preference
+_DATE_META_SELECTORS = [
+    'meta[property="article:published_time"]',
+    'meta[property="article:modified_time"]',
+    'meta[name="publishdate"]',
+    'meta[name="pubdate"]',
+    'meta[name="publicationdate"]',
+    'meta[name="date"]',
+    'meta[name="DC.date"]',
+    'meta[name="dcterms.date"]',
+    'meta[itemprop="datePublished"]',
+    'meta[itemprop="dateModified"]',
+]
+
+# Collects candidate publication date strings in one WebDriver round-trip:
+# content of the first match of each selector in arguments[0], then every time[datetime].
+_DATE_CANDIDATES_JS = """
+    var dates = [];
+    arguments[0].forEach(function(sel) {
+        var meta = document.querySelector(sel);
+        if (meta && meta.content) dates.push(meta.content);
+    });
+    document.querySelectorAll('time[datetime]').forEach(function(el) {
+        var value = el.getAttribute('datetime');
+        if (value) dates.push(value);
+    });
+    return dates;
+"""
+
+# Month names, longest first (substituted for MONTH below)
+_MONTH_NAMES = r'\b(' + '|'.join(sorted(_MONTHS, key=len, reverse=True)) + r')\b'
+# All absolute date formats in one pattern; the outer named group tells which one matched
+_DATE_RE = re.compile(r"""
+    (?P<month_day_year> MONTH \s+(\d{1,2}),?\s+(\d{4}))  # "January 15, 2020", "Jan 15, 2020", "Nov 16 2025"
+  | (?P<day_month_year> (\d{1,2})\s+ MONTH \s+(\d{4}))    # "15 January 2020", "16 March 2024"
+  | (?P<iso> (\d{4})[-/](\d{1,2})[-/](\d{1,2}))         # "2020-01-15", "2020/01/15"
+  | (?P<eu_or_us> (\d{1,2})/(\d{1,2})/(\d{4}))          # "01/15/2020", "15/01/2020"
+  | (?P<dotted> (\d{4})\.(\d{1,2})\.(\d{1,2}))          # "2020.01.15"
+  | (?P<month_year> MONTH \s+(\d{4}))                    # "January 2020" (month and year only)
+""".replace('MONTH', _MONTH_NAMES), re.IGNORECASE | re.VERBOSE)
+
+_DATE_FORMATTERS = {
+    'month_day_year': _format_month_day_year,
+    'day_month_year': _format_day_month_year,
+    'iso': _format_year_month_day,
+    'eu_or_us': _try_eu_or_us_format,
+    'dotted': _format_year_month_day,
+    'month_year': _format_month_year,
+}
+
+# Class/id tokens of footer, tag, sharing and similar non-content elements
+_BAD_TOKEN_RE = re.compile(r'footer|tag|related|share|social|comment|author|newsletter|sidebar', re.IGNORECASE)
+
+# Publication date patterns tried on each of an article's first lines, in order
+_TEXT_DATE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:published|posted|updated|date|on|by)\s*:?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
+    r'(?:published|posted|updated|date|on|by)\s*:?\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})',  # "16 March 2024"
+    r'(?:published|posted|updated|date|on|by)\s*:?\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2})',
+    r'(?:published|posted|updated|date|on|by)\s*:?\s*(\d{1,2}[-/]\d{1,2}[-/]\d{4})',
+    # Direct date patterns without prefix
+    r'\b([A-Za-z]+\s+\d{1,2},?\s+\d{4})\b',  # "Nov 16 2025" or "November 16, 2025"
+    r'\b(\d{1,2}\s+[A-Za-z]+\s+\d{4})\b',  # "16 March 2024"
+)]
+# Any date-like text, used when no line matched the patterns above
+_DATE_CANDIDATE_RE = re.compile(
+    r'\b([A-Za-z]+\s+\d{1,2},?\s+\d{4}|\d{1,2}\s+[A-Za-z]+\s+\d{4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})\b',
+    re.IGNORECASE
+)
+# Normalized article date (YYYY-MM-DD), checked before slicing out its year or month
+_ISO_DATE_RE = re.compile(r'\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])')
+
+
+def _first_lines(text: str, count: int) -> List[str]:
+    """Split off only the first count lines of text, without scanning or copying the rest."""
+    end = -1
+    for _ in range(count):
+        end = text.find('\n', end + 1)
+        if end < 0:
+            return text.split('\n')
+    return text[:end].split('\n')
+
+
+def _main_body(content: str) -> str:
+    """Estimate the main body of article content - usually the first 70-80% (excludes footer)."""
+    # Back off to the last line break before the 75% mark so no word is cut in half
+    n = int(len(content) * 0.75)
+    cut = content.rfind('\n', 0, n)
+    return content[:cut if cut > 0 else n]
+
+
+def _validate_date(date_str: str) -> bool:
+    """Validate that a date string is in correct format and reasonable."""
+    try:
+        parsed = datetime.strptime(date_str, '%Y-%m-%d')
+        # Check if date is within reasonable range (2000-2030)
+        if parsed.year < 2000 or parsed.year > 2030:
+            return False
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(date_text: str) -> Optional[str]:
+    """
+    Parse date from various formats using multiple strategies.
+    
+    Cached, since the same date strings recur across meta tags, bylines and articles.
+    
+    Args:
+        date_text: Stripped date string in various formats.
+        
+    Returns:
+        Date string in YYYY-MM-DD format or None.
+    """
+    # Try using dateutil parser first (if available)
+    if _DATEUTIL_PARSE is not None:
+        try:
+            return _DATEUTIL_PARSE(date_text, fuzzy=True, default=_DEFAULT_DT).strftime('%Y-%m-%d')
+        except (ValueError, TypeError):
+            pass
+    
+    for match in _DATE_RE.finditer(date_text):
+        # Groups of the formats that didn't match are None
+        parts = [group for group in match.groups() if group is not None][1:]
+        try:
+            result = _DATE_FORMATTERS[match.lastgroup](*parts)
+            if result and _validate_date(result):
+                return result
+        except (ValueError, TypeError):
+            continue
+    
+    return None
+
+
+@dataclass(slots=True)
 class Article:
     """Data class to parse and store article information"""
     title: str
@@ -44,16 +394,81 @@ class Article:
     snippet: str
     date: Optional[str] = None
     full_content: Optional[str] = None
-    industries: List[str] = None
-    countries: List[str] = None
-    country_mentions: Dict[str, int] = None  # Count of mentions per country
+    industries: List[str] = field(default_factory=list)
+    countries: List[str] = field(default_factory=list)
+    country_mentions: Dict[str, int] = field(default_factory=dict)  # Count of mentions per country
     attack_method: Optional[str] = None  # 'direct', 'proxy', or 'unknown'
+
+
+def _build_keyword_automaton(industry_keywords: Dict[str, List[str]], country_keywords: Set[str],
+                             security_services: Dict[str, List[str]]):
+    """
+    Build a single Aho-Corasick automaton over all industry, country and security service keywords.
+    
+    Args:
+        industry_keywords: Mapping of industry name to keyword list.
+        country_keywords: Set of country keywords.
+        security_services: Mapping of attack method ('direct'/'proxy') to keyword list.
+        
+    Returns:
+        Automaton yielding (keyword, ((category, value), ...)) payloads,
+        or None if pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    
+    # A keyword may be listed under several industries, so collect all tags per keyword
+    keyword_tags = defaultdict(set)
+    for industry, keywords in industry_keywords.items():
+        for keyword in keywords:
+            keyword_tags[keyword.lower()].add(('industry', industry))
+    for country in country_keywords:
+        keyword_tags[country.lower()].add(('country', country))
+    for method, keywords in security_services.items():
+        for keyword in keywords:
+            keyword_tags[keyword.lower()].add(('attack', method))
     
-    def __post_init__(self):
-        """Initialize lists"""
-        self.industries = []
-        self.countries = []
-        self.country_mentions = {}
+    automaton = ahocorasick.Automaton()
+    for keyword, tags in keyword_tags.items():
+        automaton.add_word(keyword, (keyword, tuple(tags)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_boilerplate(class_name: str, elem_id: str) -> bool:
+    """Check whether an element's class/id marks it as footer, tags, sharing links, etc."""
+    return bool(_BAD_TOKEN_RE.search(class_name) or _BAD_TOKEN_RE.search(elem_id))
+
+
+def _mark_line_breaks(tree: "HTMLParser") -> None:
+    """Mark where innerText would break lines (around block elements and at <br>) in a parsed page."""
+    for node in tree.css(_BLOCK_SELECTOR):
+        node.insert_before(_LINE_BREAK)
+        node.insert_after(_LINE_BREAK)
+    for node in tree.css('br'):
+        node.replace_with(_LINE_BREAK)
+    # innerText separates table cells on the same line
+    for node in tree.css('td, th'):
+        node.insert_after(' ')
+
+
+def _node_text(node) -> str:
+    """
+    Get a parsed node's text laid out like the browser's innerText (after _mark_line_breaks).
+    
+    Inline elements stay on their line, source whitespace is collapsed and
+    each block element starts a new line; empty lines are dropped.
+    """
+    text = _WHITESPACE_RE.sub(' ', node.text(separator='', strip=False))
+    lines = (line.strip() for line in text.split(_LINE_BREAK))
+    return '\n'.join(line for line in lines if line)
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is not part of a longer word (same as regex \\b on both sides)."""
+    before = text[start - 1] if start > 0 else ' '
+    after = text[end] if end < len(text) else ' '
+    return not (before.isalnum() or before == '_' or after.isalnum() or after == '_')
 
 
 class GoogleScraper:
@@ -176,6 +591,42 @@ class GoogleScraper:
         'italy', 'greece', 'portugal', 'moldova', 'austria', 'switzerland'
     }
     
+    # Standard names for country keywords and aliases (others are title-cased)
+    _COUNTRY_NORM = {
+        'uk': 'United Kingdom',
+        'gb': 'United Kingdom',
+        'united kingdom': 'United Kingdom',
+        'great britain': 'United Kingdom',
+        'britain': 'United Kingdom',
+        'england': 'United Kingdom',
+        'ukraine': 'Ukraine',
+        'poland': 'Poland',
+        'germany': 'Germany',
+        'france': 'France',
+        'estonia': 'Estonia',
+        'latvia': 'Latvia',
+        'lithuania': 'Lithuania',
+        'czech': 'Czech Republic',
+        'czechia': 'Czech Republic',
+        'czech republic': 'Czech Republic',
+        'slovakia': 'Slovakia',
+        'romania': 'Romania',
+        'bulgaria': 'Bulgaria',
+        'finland': 'Finland',
+        'sweden': 'Sweden',
+        'norway': 'Norway',
+        'denmark': 'Denmark',
+        'netherlands': 'Netherlands',
+        'belgium': 'Belgium',
+        'spain': 'Spain',
+        'italy': 'Italy',
+        'greece': 'Greece',
+        'portugal': 'Portugal',
+        'moldova': 'Moldova',
+        'luxembourg': 'Luxembourg',
+        'hungary': 'Hungary',
+    }
+    
     # Security service identifiers
     SECURITY_SERVICES = {
         'direct': ['gru', 'svr', 'fsb', 'russian intelligence'],
@@ -185,23 +636,61 @@ class GoogleScraper:
                   'ultranationalist', 'ultranationalists', 'ultranationalist group', 'ultranationalist groups']
     }
     
-    def __init__(self, headless: bool = False):
+    # Lowercased once at class load; analysis text is lowercased before matching
+    INDUSTRY_KEYWORDS_FS = {
+        industry: frozenset(keyword.lower() for keyword in keywords)
+        for industry, keywords in INDUSTRY_KEYWORDS.items()
+    }
+    COUNTRY_KEYWORDS_FS = frozenset(country.lower() for country in COUNTRY_KEYWORDS)
+    SECURITY_SERVICES_FS = {
+        method: frozenset(keyword.lower() for keyword in keywords)
+        for method, keywords in SECURITY_SERVICES.items()
+    }
+    # All country keywords as whole words in one pattern, longest first so
+    # "czech republic" wins over "czech"
+    COUNTRY_RE = re.compile(
+        r'\b(' + '|'.join(re.escape(country) for country in sorted(COUNTRY_KEYWORDS_FS, key=len, reverse=True)) + r')\b'
+    )
+    
+    # Single-pass matcher over all keywords above (None without pyahocorasick)
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(INDUSTRY_KEYWORDS_FS, COUNTRY_KEYWORDS_FS, SECURITY_SERVICES_FS)
+    
+    def __init__(self, headless: bool = False, inter_page_delay: float = 0, max_workers: int = 3,
+                 profile_dir: str = str(Path(tempfile.gettempdir()) / "arbitr_profile"),
+                 page_load_timeout: float = 10):
         """
         Initialize the scraper.
         
         Args:
             headless: Whether to run browser in headless mode.
+            inter_page_delay: Seconds to pause between result pages (polite throttling).
+            max_workers: Maximum number of browsers loading pages concurrently.
+            profile_dir: Prefix for the persistent Chrome profiles (one per browser,
+                suffixed with its index) that keep cookie consent between runs.
+            page_load_timeout: Seconds to wait for a page load before using what has loaded so far.
         """
         self.options = webdriver.ChromeOptions()
         self.options.add_argument("--no-sandbox")
         self.options.add_argument("--disable-dev-shm-usage")
         self.options.add_argument("--disable-blink-features=AutomationControlled")
         self.options.add_argument("--disable-gpu")
-        self.options.add_argument("--remote-debugging-port=9222")
+        
+        # Skip startup work the scraper never needs
+        self.options.add_argument("--disable-extensions")
+        self.options.add_argument("--disable-background-networking")
+        self.options.add_argument("--disable-sync")
+        self.options.add_argument("--metrics-recording-only")
         
         if headless:
             self.options.add_argument("--headless=new")
         
+        # Only page text is scraped, so don't download images or show notifications
+        self.options.add_argument("--blink-settings=imagesEnabled=false")
+        self.options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        
         # Remove automation indicators
         self.options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         self.options.add_experimental_option('useAutomationExtension', False)
@@ -209,13 +698,29 @@ class GoogleScraper:
         
         self.driver: Optional[webdriver.Chrome] = None
         self.articles: List[Article] = []
+        self.inter_page_delay = inter_page_delay
+        self.max_workers = max_workers
+        self.profile_dir = profile_dir
+        self.page_load_timeout = page_load_timeout
+        
+        # Browser pool shared by worker threads (see _worker_driver)
+        self._drivers: List[webdriver.Chrome] = []
+        self._idle_drivers: queue.Queue = queue.Queue()
+        self._drivers_lock = threading.Lock()
+        self._profile_count = 0
+        
+        # Per-thread HTTP session for static article fetches (see _http_session)
+        self._http = threading.local()
+        
+        # Session IDs of browsers whose consent banner has been dealt with
+        self._consent_handled: Set[str] = set()
         
     def __enter__(self):
         """Context manager entry."""
         logger.info("Initializing ChromeDriver...")
         
         try:
-            self.driver = webdriver.Chrome(options=self.options)
+            self.driver = self._create_driver()
             logger.info("ChromeDriver initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize ChromeDriver: {e}")
@@ -223,79 +728,108 @@ class GoogleScraper:
             logger.error("Download from: https://chromedriver.chromium.org/")
             raise
         
-        # Test navigation to ensure driver works
-        try:
-            self.driver.get("about:blank")
-            time.sleep(0.5)
-            self.driver.get("https://www.google.com")
-            time.sleep(1)
-        except Exception as e:
-            logger.warning(f"Navigation test failed: {e}, continuing anyway...")
-        
         # Hide webdriver property
         try:
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         except Exception:
             pass
         
+        # The main browser also serves worker threads
+        self._idle_drivers.put(self.driver)
+        
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        if self.driver:
-            self.driver.quit()
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    
+    def _create_driver(self) -> webdriver.Chrome:
+        """
+        Start a new Chrome instance and register it for cleanup on exit.
+        
+        Each browser gets its own persistent profile, since Chrome locks a
+        profile directory to a single running instance.
+        
+        Returns:
+            Chrome WebDriver instance.
+        """
+        with self._drivers_lock:
+            profile_index = self._profile_count
+            self._profile_count += 1
+        
+        options = copy.deepcopy(self.options)
+        options.add_argument(f"--user-data-dir={self.profile_dir}_{profile_index}")
+        
+        driver = webdriver.Chrome(options=options)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        with self._drivers_lock:
+            self._drivers.append(driver)
+        return driver
+    
+    @contextmanager
+    def _worker_driver(self, warm_up: bool = True):
+        """
+        Check out a browser from the pool for the calling thread.
+        
+        Starts a new browser if none is idle. The pool never exceeds the number
+        of concurrent worker threads.
+        
+        Args:
+            warm_up: Whether a new browser should load Google and accept consent
+                first (not needed for browsers that only fetch articles).
+        
+        Yields:
+            Chrome WebDriver instance, returned to the pool afterwards.
+        """
+        try:
+            driver = self._idle_drivers.get_nowait()
+        except queue.Empty:
+            driver = self._create_driver()
+            if warm_up:
+                driver.get("https://www.google.com")
+                self._handle_terms_and_conditions(driver)
+        
+        try:
+            yield driver
+        finally:
+            self._idle_drivers.put(driver)
     
-    def _handle_terms_and_conditions(self) -> None:
+    def _handle_terms_and_conditions(self, driver: Optional[webdriver.Chrome] = None,
+                                     results_page: bool = False) -> None:
         """
         Handle Google Terms and Conditions acceptance if present.
+        
+        Consent is stored in the browser's cookies, so a browser is no longer
+        checked once consent was accepted, or once no banner showed up on an
+        actual results page.
+        
+        Args:
+            driver: Browser to check (defaults to the main driver).
+            results_page: Whether the browser is showing a search results page.
         """
+        driver = driver or self.driver
+        if driver.session_id in self._consent_handled:
+            return
+        
         try:
-            
-            # Try multiple selectors for Terms and Conditions / Cookie consent buttons
-            selectors = [
-                # Common Google T&C button selectors
-                "//button[contains(text(), 'I agree')]",
-                "//button[contains(text(), 'Accept')]",
-                "//button[contains(text(), 'Accept all')]",
-                "//button[contains(text(), 'Agree')]",
-                "//div[@id='introAgreeButton']",
-                "//button[@id='L2AGLb']",  # Google's "I agree" button ID
-                "//button[contains(@aria-label, 'Accept')]",
-                "//button[contains(@aria-label, 'I agree')]",
-                # Cookie consent variations
-                "//button[contains(text(), 'Accept all cookies')]",
-                "//button[contains(text(), 'Reject all')]",  # Sometimes we need to reject to proceed
-                # European cookie consent
-                "//button[contains(@class, 'accept')]",
-                "//button[contains(@class, 'agree')]",
-            ]
-            
-            for selector in selectors:
-                try:
-                    button = WebDriverWait(self.driver, 1).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    if button.is_displayed():
-                        button.click()
-                        logger.info("Accepted Terms and Conditions / Cookies")
-                        time.sleep(0.5)
-                        return
-                except (TimeoutException, NoSuchElementException):
-                    continue
-            
-            # Also try by ID and class name
-            try:
-                agree_button = self.driver.find_element(By.ID, "L2AGLb")
-                if agree_button.is_displayed():
-                    agree_button.click()
-                    logger.info("Accepted Terms and Conditions")
-                    time.sleep(0.5)
-                    return
-            except NoSuchElementException:
-                pass
-                
-        except Exception as e:
-            # Silently continue if T&C handling fails
+            button = WebDriverWait(driver, 2).until(
+                EC.element_to_be_clickable((By.XPATH, _CONSENT_XPATH))
+            )
+            button.click()
+            logger.info("Accepted Terms and Conditions / Cookies")
+            time.sleep(0.5)
+            self._consent_handled.add(driver.session_id)
+        except TimeoutException:
+            # No banner on a results page: consent is already stored (e.g. in the
+            # persistent profile). Elsewhere it may just be slow to render, so check again later
+            if results_page:
+                self._consent_handled.add(driver.session_id)
+        except Exception:
+            # Silently continue if T&C is absent or handling fails
             pass
     
     def search_google(self, query: str, start_date: str, end_date: str, max_results: int = 1000) -> List[Article]:
@@ -311,7 +845,28 @@ class GoogleScraper:
         Returns:
             List of Article objects.
         """
-        articles = []
+        self.articles = list(self.iter_search_results(query, start_date, end_date, max_results))
+        return self.articles
+    
+    def iter_search_results(self, query: str, start_date: str, end_date: str,
+                            max_results: int = 1000) -> Iterator[Article]:
+        """
+        Search Google with date filtering, yielding articles as each results page arrives.
+        
+        Lets callers process or persist results on the fly instead of holding
+        them all in memory. Pages stop loading once the caller stops iterating.
+        
+        Args:
+            query: Search query string.
+            start_date: Start date in format 'YYYY-MM-DD'.
+            end_date: End date in format 'YYYY-MM-DD'.
+            max_results: Maximum number of results to retrieve.
+            
+        Yields:
+            Article objects, in search result order.
+        """
+        total = 0
+        seen_urls: Set[str] = set()
         results_per_page = 10
         max_pages = 30  # Limit to first 30 pages
         pages_needed = min((max_results + results_per_page - 1) // results_per_page, max_pages)
@@ -329,7 +884,6 @@ class GoogleScraper:
             if current_url == "data:," or "data:" in current_url:
                 logger.warning("Detected data: URL, navigating to Google...")
                 self.driver.get("https://www.google.com")
-                time.sleep(1)
         except Exception as e:
             logger.warning(f"Error checking URL: {e}, attempting navigation...")
         
@@ -337,69 +891,87 @@ class GoogleScraper:
         logger.info("Loading Google homepage to accept Terms and Conditions...")
         try:
             self.driver.get("https://www.google.com")
-            time.sleep(1)
             # Verify we actually navigated
             current_url = self.driver.current_url.lower()
             if "data:" in current_url or ("google" not in current_url and "about:blank" not in current_url):
                 logger.warning(f"Navigation issue - current URL: {self.driver.current_url}")
                 logger.info("Retrying navigation...")
                 self.driver.get("https://www.google.com")
-                time.sleep(1.5)
         except Exception as e:
             logger.error(f"Error navigating to Google: {e}")
             raise
         
         self._handle_terms_and_conditions()
         
-        for page in range(pages_needed):
-            start_index = page * results_per_page
-            url = self._build_search_url(query, start_date, end_date, start_index)
-            
-            try:
-                logger.info(f"Loading page {page + 1} (results {start_index + 1}-{start_index + results_per_page})...")
-                self.driver.get(url)
-                time.sleep(0.5)  # Wait for page to load
-                
-                # Handle Terms and Conditions on first page (in case it appears again)
-                if page == 0:
-                    self._handle_terms_and_conditions()
-                    time.sleep(0.5)
-                
-                # Extract search results
-                page_articles = self._extract_search_results()
+        # Result pages are independent, so load them concurrently in pooled browsers
+        urls = [
+            self._build_search_url(query, start_date, end_date, page * results_per_page)
+            for page in range(pages_needed)
+        ]
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            # map() yields pages in order, so the stop conditions below behave as before
+            for page, page_articles in enumerate(executor.map(self._fetch_search_page, range(pages_needed), urls)):
+                if page_articles is None:
+                    # If first page fails, break; for subsequent pages, try to continue
+                    if page == 0:
+                        break
+                    continue
                 
                 if not page_articles:
                     logger.info(f"No more results found at page {page + 1}")
                     break
                 
                 # Check if we got duplicate results (might indicate we've reached the end)
-                if page > 0 and page_articles:
-                    # Check if first article from this page is already in our list
-                    if page_articles[0].url in [a.url for a in articles]:
-                        logger.info(f"Duplicate results detected at page {page + 1}, stopping pagination")
-                        break
-                    
-                articles.extend(page_articles)
-                logger.info(f"Page {page + 1}: Found {len(page_articles)} articles (Total: {len(articles)})")
-                
-                if len(articles) >= max_results:
-                    logger.info(f"Reached maximum results limit ({max_results})")
+                if page_articles[0].url in seen_urls:
+                    logger.info(f"Duplicate results detected at page {page + 1}, stopping pagination")
                     break
-                    
-                time.sleep(0.5)  # Brief pause between pages
                 
-            except Exception as e:
-                logger.error(f"Error on page {page + 1}: {e}")
-                # Try to continue with next page if possible
-                if page == 0:
-                    # If first page fails, break
+                # Drop any other results already found on earlier pages
+                page_articles = [a for a in page_articles if a.url not in seen_urls][:max_results - total]
+                seen_urls.update(a.url for a in page_articles)
+                total += len(page_articles)
+                logger.info(f"Page {page + 1}: Found {len(page_articles)} articles (Total: {total})")
+                
+                yield from page_articles
+                
+                if total >= max_results:
+                    logger.info(f"Reached maximum results limit ({max_results})")
                     break
-                else:
-                    # For subsequent pages, try to continue
-                    continue
+        finally:
+            # Don't load pages past the point where we stopped (or the caller stopped iterating)
+            executor.shutdown(cancel_futures=True)
+    
+    def _fetch_search_page(self, page: int, url: str) -> Optional[List[Article]]:
+        """
+        Load one search results page in a pooled browser and extract its results.
         
-        self.articles = articles[:max_results]
-        return self.articles
+        Args:
+            page: Zero-based page number.
+            url: Search results URL for the page.
+            
+        Returns:
+            List of Article objects, or None if the page failed to load.
+        """
+        try:
+            with self._worker_driver() as driver:
+                logger.info(f"Loading page {page + 1}...")
+                driver.get(url)
+                
+                # Handle Terms and Conditions in case it appears on the results page
+                # (no-op once this browser's consent is known to be stored)
+                self._handle_terms_and_conditions(driver, results_page=True)
+                
+                page_articles = self._extract_search_results(driver)
+                
+                if self.inter_page_delay:
+                    time.sleep(self.inter_page_delay)  # Brief pause before this browser loads another page
+                
+                return page_articles
+        except Exception as e:
+            logger.error(f"Error on page {page + 1}: {e}")
+            return None
     
     def _build_search_url(self, query: str, start_date: str, end_date: str, start: int = 0) -> str:
         """
@@ -436,68 +1008,41 @@ class GoogleScraper:
         query_string = urlencode(params)
         return f"{base_url}?{query_string}"
     
-    def _extract_search_results(self) -> List[Article]:
+    def _extract_search_results(self, driver: Optional[webdriver.Chrome] = None) -> List[Article]:
         """
         Extract search results from current page.
         
+        Args:
+            driver: Browser showing the results page (defaults to the main driver).
+            
         Returns:
             List of Article objects.
         """
+        driver = driver or self.driver
         articles = []
         
         try:
-            # Wait for search results to load
-            time.sleep(0.5)
-            
-            # Find all search result containers - use more specific selectors
-            # Google uses various selectors, try multiple approaches
-            selectors = [
-                "div.g",  # Standard Google result container
-                "div[data-ved]",  # Results with data-ved attribute
-                "div.tF2Cxc",  # Alternative container class
-            ]
-            
-            results = []
-            for selector in selectors:
-                try:
-                    results = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if results:
-                        break
-                except Exception:
-                    continue
+            # Wait for search results to render instead of sleeping a fixed time
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'div.g, div.tF2Cxc, #search'))
+                )
+            except TimeoutException:
+                pass  # Extract whatever rendered (e.g. a page without results)
             
-            if not results:
-                # Fallback: try to find any div with an h3 and link
-                all_divs = self.driver.find_elements(By.CSS_SELECTOR, "div")
-                for div in all_divs:
-                    try:
-                        div.find_element(By.CSS_SELECTOR, "h3")
-                        div.find_element(By.CSS_SELECTOR, "a[href]")
-                        results.append(div)
-                    except NoSuchElementException:
-                        continue
+            # Extract all results in the browser with a single round-trip
+            results = driver.execute_script(_SEARCH_RESULTS_JS) or []
             
             seen_urls = set()  # Avoid duplicates
+            now = datetime.now()  # Reference time for relative dates on this page
             
             for result in results:
                 try:
-                    # Extract title
-                    try:
-                        title_elem = result.find_element(By.CSS_SELECTOR, "h3")
-                        title = title_elem.text.strip()
-                    except NoSuchElementException:
-                        continue
-                    
-                    if not title:
+                    title = result.get('title')
+                    url = result.get('url')
+                    if not title or not url:
                         continue
-                    
-                    # Extract URL
-                    try:
-                        link_elem = result.find_element(By.CSS_SELECTOR, "a[href]")
-                        url = link_elem.get_attribute("href")
-                        if not url or url.startswith('javascript:') or 'google.com' in url and '/search' in url:
-                            continue
-                    except NoSuchElementException:
+                    if url.startswith('javascript:') or 'google.com' in url and '/search' in url:
                         continue
                     
                     # Skip duplicates
@@ -505,65 +1050,20 @@ class GoogleScraper:
                         continue
                     seen_urls.add(url)
                     
-                    # Extract snippet
-                    snippet = ""
-                    try:
-                        snippet_selectors = [
-                            "div.VwiC3b",
-                            "span.st",
-                            "div.s",
-                            ".IsZvec"
-                        ]
-                        for sel in snippet_selectors:
-                            try:
-                                snippet_elem = result.find_element(By.CSS_SELECTOR, sel)
-                                snippet = snippet_elem.text.strip()
-                                if snippet:
-                                    break
-                            except NoSuchElementException:
-                                continue
-                    except Exception:
-                        pass
-                    
-                    # Extract date from Google search results (index data)
+                    # Google often shows dates like "Jan 15, 2020" or "3 days ago"
                     date = None
-                    try:
-                        # Try multiple selectors for Google's date display
-                        date_selectors = [
-                            "span.f",  # Standard date span
-                            "span.fG8Fp",  # Alternative date span
-                            ".fG8Fp",  # Date class
-                            "span[style*='color']",  # Date with color styling
-                            ".f",  # Generic date class
-                            "span.LEwnzc",  # Another Google date selector
-                            "span.fG8Fp.LEwnzc",  # Combined selectors
-                            "div.fG8Fp",  # Date in div
-                            "span[class*='f']",  # Any span with 'f' in class
-                        ]
-                        for sel in date_selectors:
-                            try:
-                                date_elem = result.find_element(By.CSS_SELECTOR, sel)
-                                date_text = date_elem.text.strip()
-                                if date_text:  # Only process non-empty text
-                                    # Google often shows dates like "Jan 15, 2020" or "3 days ago"
-                                    date = self._parse_google_date(date_text)
-                                    if date:
-                                        break
-                            except NoSuchElementException:
-                                continue
-                    except Exception:
-                        pass
+                    for date_text in result.get('dates') or []:
+                        date = self._parse_google_date(date_text, now)
+                        if date:
+                            break
                     
-                    if title and url:
-                        article = Article(
-                            title=title,
-                            url=url,
-                            snippet=snippet,
-                            date=date
-                        )
-                        articles.append(article)
-                        
-                except (NoSuchElementException, Exception) as e:
+                    articles.append(Article(
+                        title=title,
+                        url=url,
+                        snippet=result.get('snippet') or '',
+                        date=date
+                    ))
+                except Exception:
                     continue
                     
         except Exception as e:
@@ -571,12 +1071,13 @@ class GoogleScraper:
         
         return articles
     
-    def _parse_google_date(self, date_text: str) -> Optional[str]:
+    def _parse_google_date(self, date_text: str, now: Optional[datetime] = None) -> Optional[str]:
         """
         Parse date from Google search results, handling relative dates.
         
         Args:
             date_text: Date string from Google (may include relative dates like "3 days ago").
+            now: Reference time for relative dates (defaults to the current time).
             
         Returns:
             Date string in YYYY-MM-DD format or None.
@@ -586,61 +1087,17 @@ class GoogleScraper:
         
         date_text = date_text.strip().lower()
         
-        # Handle relative dates like "3 days ago", "2 weeks ago", "1 month ago"
-        # Days ago
-        match = re.search(r'(\d+)\s+day[s]?\s+ago', date_text)
-        if match:
-            try:
-                days = int(match.group(1))
-                date_obj = datetime.now() - timedelta(days=days)
-                return date_obj.strftime('%Y-%m-%d')
-            except Exception:
-                pass
-        
-        # Weeks ago
-        match = re.search(r'(\d+)\s+week[s]?\s+ago', date_text)
-        if match:
-            try:
-                weeks = int(match.group(1))
-                date_obj = datetime.now() - timedelta(weeks=weeks)
-                return date_obj.strftime('%Y-%m-%d')
-            except Exception:
-                pass
-        
-        # Months ago
-        match = re.search(r'(\d+)\s+month[s]?\s+ago', date_text)
-        if match:
-            try:
-                months = int(match.group(1))
-                date_obj = datetime.now() - timedelta(days=months * 30)
-                return date_obj.strftime('%Y-%m-%d')
-            except Exception:
-                pass
-        
-        # Years ago
-        match = re.search(r'(\d+)\s+year[s]?\s+ago', date_text)
+        # Handle relative dates like "3 days ago", "2 weeks ago", "1 month ago", "yesterday", "today"
+        match = _REL_DATE_RE.search(date_text)
         if match:
-            try:
-                years = int(match.group(1))
-                date_obj = datetime.now() - timedelta(days=years * 365)
-                return date_obj.strftime('%Y-%m-%d')
-            except Exception:
-                pass
-        
-        # Yesterday
-        if 'yesterday' in date_text:
-            try:
-                date_obj = datetime.now() - timedelta(days=1)
-                return date_obj.strftime('%Y-%m-%d')
-            except Exception:
-                pass
-        
-        # Today
-        if 'today' in date_text:
-            try:
-                return datetime.now().strftime('%Y-%m-%d')
-            except Exception:
-                pass
+            if match[1]:
+                days = int(match[1]) * _UNIT[match[2]]
+            elif match[3]:
+                days = 1
+            else:
+                days = 0
+            date_obj = (now or datetime.now()) - timedelta(days=days)
+            return date_obj.strftime('%Y-%m-%d')
         
         # If not a relative date, use standard date parsing
         return self._parse_date(date_text)
@@ -658,122 +1115,39 @@ class GoogleScraper:
         if not date_text:
             return None
         
-        date_text = date_text.strip()
-        
-        # Try using dateutil parser first (if available)
-        try:
-            from dateutil import parser as date_parser
-            parsed_date = date_parser.parse(date_text, fuzzy=True, default=datetime(2020, 1, 1))
-            return parsed_date.strftime('%Y-%m-%d')
-        except (ImportError, ValueError, TypeError):
-            pass
-        
-        # Comprehensive regex patterns for various date formats
-        months = {
-            'jan': '01', 'january': '01', 'feb': '02', 'february': '02',
-            'mar': '03', 'march': '03', 'apr': '04', 'april': '04',
-            'may': '05', 'jun': '06', 'june': '06', 'jul': '07', 'july': '07',
-            'aug': '08', 'august': '08', 'sep': '09', 'sept': '09', 'september': '09',
-            'oct': '10', 'october': '10', 'nov': '11', 'november': '11',
-            'dec': '12', 'december': '12'
-        }
-        
-        patterns = [
-            # Format: "January 15, 2020" or "Jan 15, 2020" or "Nov 16 2025" (no comma)
-            (r'(\w+)\s+(\d{1,2}),?\s+(\d{4})', lambda m: self._format_date_from_match(m, months, 'month_day_year')),
-            # Format: "15 January 2020" or "15 Jan 2020" or "16 March 2024"
-            (r'(\d{1,2})\s+(\w+)\s+(\d{4})', lambda m: self._format_date_from_match(m, months, 'day_month_year')),
-            # Format: "2020-01-15" or "2020/01/15"
-            (r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})', lambda m: f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
-            # Format: "01/15/2020" or "15/01/2020" (try both US and EU)
-            (r'(\d{1,2})/(\d{1,2})/(\d{4})', lambda m: self._try_eu_or_us_format(m)),
-            # Format: "2020.01.15"
-            (r'(\d{4})\.(\d{1,2})\.(\d{1,2})', lambda m: f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
-            # Format: "January 2020" (month and year only)
-            (r'(\w+)\s+(\d{4})', lambda m: self._format_month_year(m, months)),
-        ]
-        
-        for pattern, formatter in patterns:
-            match = re.search(pattern, date_text, re.IGNORECASE)
-            if match:
-                try:
-                    result = formatter(match)
-                    if result and self._validate_date(result):
-                        return result
-                except (ValueError, IndexError, AttributeError):
-                    continue
-        
-        return None
+        return _parse_date_str(date_text.strip())
     
-    def _format_date_from_match(self, match, months: Dict[str, str], format_type: str) -> Optional[str]:
-        """Format date from regex match based on format type."""
-        groups = match.groups()
-        if len(groups) < 3:
-            return None
+    def fetch_article_content(self, article: Article, driver: Optional[webdriver.Chrome] = None) -> str:
+        """
+        Fetch full content of an article and extract date.
         
-        if format_type == 'month_day_year':
-            month_str = groups[0].lower()
-            day = groups[1]
-            year = groups[2]
-        elif format_type == 'day_month_year':
-            day = groups[0]
-            month_str = groups[1].lower()
-            year = groups[2]
-        else:
-            return None
+        Static pages are fetched over plain HTTP when requests and selectolax are
+        installed; Selenium is used for the rest. With selectolax, a browser-loaded
+        page is parsed from a single page_source snapshot.
         
-        month = months.get(month_str)
-        if month:
-            return f"{year}-{month}-{day.zfill(2)}"
-        return None
-    
-    def _try_eu_or_us_format(self, match) -> str:
-        """Try both EU (DD/MM/YYYY) and US (MM/DD/YYYY) formats."""
-        groups = match.groups()
-        day, month, year = groups[0], groups[1], groups[2]
-        
-        # If first number > 12, it's likely EU format (day)
-        if int(day) > 12:
-            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        # Otherwise try US format
-        elif int(month) > 12:
-            return f"{year}-{day.zfill(2)}-{month.zfill(2)}"
-        else:
-            # Ambiguous - prefer US format
-            return f"{year}-{day.zfill(2)}-{month.zfill(2)}"
-    
-    def _format_month_year(self, match, months: Dict[str, str]) -> Optional[str]:
-        """Format month and year only (use first day of month)."""
-        groups = match.groups()
-        if len(groups) < 2:
-            return None
-        month_str = groups[0].lower()
-        year = groups[1]
-        month = months.get(month_str)
-        if month:
-            return f"{year}-{month}-01"
-        return None
-    
-    def _validate_date(self, date_str: str) -> bool:
-        """Validate that a date string is in correct format and reasonable."""
-        try:
-            parsed = datetime.strptime(date_str, '%Y-%m-%d')
-            # Check if date is within reasonable range (2000-2030)
-            if parsed.year < 2000 or parsed.year > 2030:
-                return False
-            return True
-        except ValueError:
-            return False
+        Args:
+            article: Article object with URL.
+            driver: Browser to load the article in (defaults to the main driver).
+            
+        Returns:
+            Full article text content.
+        """
+        content_text = self._fetch_content_without_browser(article)
+        if content_text is not None:
+            return content_text
+        
+        return self._fetch_browser_content(article, driver or self.driver)
     
-    def fetch_article_content(self, article: Article) -> str:
+    def _fetch_content_without_browser(self, article: Article) -> Optional[str]:
         """
-        Fetch full content of an article using Selenium and extract date.
+        Get an article's content if it doesn't need a browser.
         
         Args:
             article: Article object with URL.
             
         Returns:
-            Full article text content.
+            Empty string for excluded domains, the static page content when it
+            could be fetched over HTTP, otherwise None.
         """
         # Skip YouTube, Instagram, and Vimeo URLs
         url_lower = article.url.lower()
@@ -782,87 +1156,64 @@ class GoogleScraper:
             logger.debug(f"Skipping content fetch for excluded domain: {article.url}")
             return ""
         
-        try:
-            self.driver.get(article.url)
-            time.sleep(0.5)  # Brief wait for page load
+        return self._fetch_static_content(article)
+    
+    def _fetch_browser_content(self, article: Article, driver: webdriver.Chrome) -> str:
+        """
+        Load an article in a browser and extract its content and date.
+        
+        Args:
+            article: Article object with URL.
+            driver: Browser to load the article in.
             
-            # Extract date from article page (meta tags first, then text)
-            if not article.date:
-                article.date = self._extract_date_from_meta()
+        Returns:
+            Full article text content.
+        """
+        try:
+            try:
+                driver.get(article.url)
+            except TimeoutException:
+                # Slow page: work with whatever has loaded so far
+                logger.debug(f"Page load timed out for {article.url}, using partial page")
             
-            # Try to extract main content using common selectors, excluding footer/tags/links
-            # Remove common non-content elements first
+            # Wait for the page to finish loading rather than for a fixed time
             try:
-                # Remove footer, nav, aside, header elements
-                self.driver.execute_script("""
-                    var elements = document.querySelectorAll('footer, nav, aside, header, .footer, .nav, .sidebar, .tags, .tag, .related, .share, .social, .comments, .author-box, .newsletter');
-                    elements.forEach(function(el) { el.remove(); });
-                """)
-            except Exception:
+                WebDriverWait(driver, 5).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+            except TimeoutException:
                 pass
             
-            content_selectors = [
-                'article',
-                'main',
-                '[role="main"]',
-                '.article-content',
-                '.post-content',
-                '.entry-content',
-                '.article-body',
-                '.post-body',
-                '#content',
-                '.content',
-                'div[class*="article"]:not(.article-footer):not(.article-tags)',
-                'div[class*="content"]:not(.content-footer):not(.content-tags)',
-                'div[class*="post"]:not(.post-footer):not(.post-tags)',
-            ]
-            
-            content_text = ""
-            for selector in content_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        # Filter out elements that are likely footers/tags/links
-                        valid_elements = []
-                        for elem in elements:
-                            try:
-                                # Skip if contains common footer/tag indicators
-                                elem_class = elem.get_attribute('class') or ''
-                                elem_id = elem.get_attribute('id') or ''
-                                if any(x in (elem_class + ' ' + elem_id).lower() for x in ['footer', 'tag', 'related', 'share', 'social', 'comment', 'author', 'newsletter', 'sidebar']):
-                                    continue
-                                # Skip if mostly links
-                                links = elem.find_elements(By.TAG_NAME, 'a')
-                                text_len = len(elem.text)
-                                if text_len > 0 and len(links) / text_len > 0.3:  # More than 30% links
-                                    continue
-                                valid_elements.append(elem)
-                            except Exception:
-                                continue
-                        
-                        if valid_elements:
-                            # Get text from the largest valid element
-                            texts = [(elem.text, len(elem.text)) for elem in valid_elements if elem.text]
-                            if texts:
-                                # Use the longest text as it's likely the main content
-                                content_text = max(texts, key=lambda x: x[1])[0]
-                                if len(content_text) > 1000:  # Reasonable content length
-                                    break
-                except Exception:
-                    continue
-            
-            # If no good content found, try getting body but exclude footer/nav
-            if not content_text or len(content_text) < 1000:
+            if HTMLParser is not None:
+                # Parse one snapshot of the rendered page instead of querying the live DOM
+                content_text = self._extract_page_content(article, HTMLParser(driver.page_source), body_fallback=True)
+            else:
+                # Extract date from article page (meta tags first, then text)
+                if not article.date:
+                    article.date = self._extract_date_from_meta(driver)
+                
+                # Remove footer/nav/etc. and collect all content candidates in one round-trip
                 try:
-                    body = self.driver.find_element(By.TAG_NAME, 'body')
-                    # Try to get main content area, excluding footer
-                    main_content = body.find_elements(By.CSS_SELECTOR, 'main, article, [role="main"], .main-content')
-                    if main_content:
-                        content_text = main_content[0].text
-                    else:
-                        content_text = body.text
+                    candidates = driver.execute_script(
+                        _CONTENT_CANDIDATES_JS, _CONTENT_SELECTORS, _NON_CONTENT_SELECTOR
+                    ) or []
                 except Exception:
-                    pass
+                    candidates = []
+                
+                content_text = self._select_main_content(candidates)
+                
+                # If no good content found, try getting body but exclude footer/nav
+                if not content_text or len(content_text) < 1000:
+                    try:
+                        body = driver.find_element(By.TAG_NAME, 'body')
+                        # Try to get main content area, excluding footer
+                        main_content = body.find_elements(By.CSS_SELECTOR, 'main, article, [role="main"], .main-content')
+                        if main_content:
+                            content_text = main_content[0].text
+                        else:
+                            content_text = body.text
+                    except Exception:
+                        pass
             
             # Extract date from content if not found in meta tags
             if not article.date and content_text:
@@ -871,51 +1222,170 @@ class GoogleScraper:
             return content_text.strip()
             
         except Exception as e:
-            logger.error(f"Error fetching content from {article.url}: {e}")
-            return ""
+            logger.error(f"Error fetching content from {article.url}: {e}")
+            return ""
+    
+    @staticmethod
+    def _select_main_content(candidates: List[Dict]) -> str:
+        """
+        Pick the main content text from content candidates.
+        
+        Selectors are tried in order of preference, excluding footer/tags/links.
+        
+        Args:
+            candidates: Dicts with text, className, id, linkCount and selectors
+                (indices into _CONTENT_SELECTORS the element matches).
+            
+        Returns:
+            Main content text, or an empty string if no candidate qualifies.
+        """
+        content_text = ""
+        for rank in range(len(_CONTENT_SELECTORS)):
+            # Track the longest text as it's likely the main content
+            best_text = ""
+            for candidate in candidates:
+                if rank not in candidate['selectors'] or not candidate['text']:
+                    continue
+                # Skip if contains common footer/tag indicators
+                if _is_boilerplate(candidate['className'], candidate['id']):
+                    continue
+                # Skip if mostly links (more than 30% links)
+                if candidate['linkCount'] / len(candidate['text']) > 0.3:
+                    continue
+                if len(candidate['text']) > len(best_text):
+                    best_text = candidate['text']
+            
+            if best_text:
+                content_text = best_text
+                if len(content_text) > 1000:  # Reasonable content length
+                    break
+        
+        return content_text
+    
+    def _http_session(self) -> "requests.Session":
+        """
+        Get the calling thread's HTTP session, reused for keep-alive.
+        
+        Returns:
+            requests Session.
+        """
+        session = getattr(self._http, 'session', None)
+        if session is None:
+            session = self._http.session = requests.Session()
+            session.headers['User-Agent'] = _HTTP_USER_AGENT
+        return session
+    
+    def _fetch_static_content(self, article: Article) -> Optional[str]:
+        """
+        Fetch an article over plain HTTP and extract its content without a browser.
+        
+        Args:
+            article: Article object with URL.
+            
+        Returns:
+            Article text, or None if requests/selectolax are not installed, the page
+            could not be fetched, or it looks JS-rendered (too little static content).
+        """
+        if requests is None or HTMLParser is None:
+            return None
+        
+        try:
+            response = self._http_session().get(article.url, timeout=10)
+            if response.status_code != 200 or 'html' not in response.headers.get('Content-Type', ''):
+                return None
+            tree = HTMLParser(response.text)
+        except Exception as e:
+            logger.debug(f"Static fetch failed for {article.url}: {e}")
+            return None
+        
+        content_text = self._extract_page_content(article, tree)
+        if len(content_text) < 500:
+            return None  # Probably rendered by JavaScript
+        
+        # Extract date from content if not found in meta tags
+        if not article.date:
+            article.date = self._extract_date_from_text(content_text)
+        
+        return content_text.strip()
     
-    def _extract_date_from_meta(self) -> Optional[str]:
+    def _extract_page_content(self, article: Article, tree: "HTMLParser", body_fallback: bool = False) -> str:
         """
-        Extract publication date from HTML meta tags.
+        Extract publication date and main content from a parsed article page.
         
+        Args:
+            article: Article object, whose date is filled in from meta tags if missing.
+            tree: Parsed page (modified: non-content elements are removed).
+            body_fallback: Whether to fall back to the main area or body text when
+                no good content is found.
+            
         Returns:
-            Date string in YYYY-MM-DD format or None.
+            Main content text (not stripped), possibly empty.
         """
-        meta_selectors = [
-            ('property', 'article:published_time'),
-            ('property', 'article:modified_time'),
-            ('name', 'publishdate'),
-            ('name', 'pubdate'),
-            ('name', 'publicationdate'),
-            ('name', 'date'),
-            ('name', 'DC.date'),
-            ('name', 'dcterms.date'),
-            ('itemprop', 'datePublished'),
-            ('itemprop', 'dateModified'),
-        ]
+        # Extract date from meta tags first, then time elements
+        if not article.date:
+            date_candidates = [node.attributes.get('content') for node in map(tree.css_first, _DATE_META_SELECTORS) if node]
+            date_candidates += [node.attributes.get('datetime') for node in tree.css('time[datetime]')]
+            for candidate in date_candidates:
+                if candidate:
+                    article.date = self._parse_date(candidate)
+                    if article.date:
+                        break
         
-        for attr, value in meta_selectors:
-            try:
-                meta = self.driver.find_element(By.CSS_SELECTOR, f'meta[{attr}="{value}"]')
-                content = meta.get_attribute('content')
-                if content:
-                    parsed = self._parse_date(content)
-                    if parsed:
-                        return parsed
-            except (NoSuchElementException, Exception):
-                continue
+        # Strip non-content elements in the parsed tree (no browser DOM mutation). Unlike
+        # innerText, selectolax's text() includes script/style contents, so drop those too.
+        for node in tree.css(_STATIC_NON_CONTENT_SELECTOR):
+            node.decompose()
+        
+        # text() puts every text node on its own line unless told where innerText would break
+        _mark_line_breaks(tree)
+        
+        candidates = []
+        for rank, selector in enumerate(_CONTENT_SELECTORS):
+            for node in tree.css(selector):
+                class_name = node.attributes.get('class') or ''
+                elem_id = node.attributes.get('id') or ''
+                # Skip boilerplate before the costlier text extraction and link count
+                if _is_boilerplate(class_name, elem_id):
+                    continue
+                candidates.append({
+                    'text': _node_text(node),
+                    'className': class_name,
+                    'id': elem_id,
+                    'linkCount': len(node.css('a')),
+                    'selectors': [rank],
+                })
+        
+        content_text = self._select_main_content(candidates)
+        
+        # If no good content found, try the main content area, else the whole body
+        if body_fallback and len(content_text) < 1000:
+            node = tree.css_first('main, article, [role="main"], .main-content') or tree.body
+            if node is not None:
+                content_text = _node_text(node)
+        
+        return content_text
+    
+    def _extract_date_from_meta(self, driver: Optional[webdriver.Chrome] = None) -> Optional[str]:
+        """
+        Extract publication date from HTML meta tags.
         
-        # Try time elements with datetime attribute
+        Args:
+            driver: Browser showing the article (defaults to the main driver).
+            
+        Returns:
+            Date string in YYYY-MM-DD format or None.
+        """
+        driver = driver or self.driver
         try:
-            time_elements = self.driver.find_elements(By.CSS_SELECTOR, 'time[datetime]')
-            for time_elem in time_elements:
-                datetime_attr = time_elem.get_attribute('datetime')
-                if datetime_attr:
-                    parsed = self._parse_date(datetime_attr)
-                    if parsed:
-                        return parsed
+            candidates = driver.execute_script(_DATE_CANDIDATES_JS, _DATE_META_SELECTORS) or []
         except Exception:
-            pass
+            return None
+        
+        # Meta tags first, then time elements with datetime attribute
+        for content in candidates:
+            parsed = self._parse_date(content)
+            if parsed:
+                return parsed
         
         return None
     
@@ -931,22 +1401,12 @@ class GoogleScraper:
         """
         # Look for common date patterns in text
         # Try to find dates near the beginning of the article (where publication dates usually are)
-        lines = text.split('\n')[:30]  # Check first 30 lines
+        lines = _first_lines(text, 30)  # Check first 30 lines
         for line in lines:
             # Look for patterns like "Published: January 15, 2020" or "Date: 2020-01-15"
             # Also handle "Nov 16 2025" and "16 March 2024" formats
-            date_patterns = [
-                r'(?:published|posted|updated|date|on|by)\s*:?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-                r'(?:published|posted|updated|date|on|by)\s*:?\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})',  # "16 March 2024"
-                r'(?:published|posted|updated|date|on|by)\s*:?\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2})',
-                r'(?:published|posted|updated|date|on|by)\s*:?\s*(\d{1,2}[-/]\d{1,2}[-/]\d{4})',
-                # Direct date patterns without prefix
-                r'\b([A-Za-z]+\s+\d{1,2},?\s+\d{4})\b',  # "Nov 16 2025" or "November 16, 2025"
-                r'\b(\d{1,2}\s+[A-Za-z]+\s+\d{4})\b',  # "16 March 2024"
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+            for pattern in _TEXT_DATE_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     parsed = self._parse_date(match.group(1))
                     if parsed:
@@ -956,9 +1416,8 @@ class GoogleScraper:
         # Look for date patterns in the beginning of the article
         first_part = text[:1000]
         # Try to find dates that look like publication dates (not random dates in content)
-        date_candidates = re.findall(r'\b([A-Za-z]+\s+\d{1,2},?\s+\d{4}|\d{1,2}\s+[A-Za-z]+\s+\d{4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})\b', first_part, re.IGNORECASE)
-        for candidate in date_candidates[:5]:  # Check first 5 candidates
-            parsed = self._parse_date(candidate)
+        for match in islice(_DATE_CANDIDATE_RE.finditer(first_part), 5):  # Check first 5 candidates
+            parsed = self._parse_date(match.group(1))
             if parsed:
                 # Validate it's a reasonable date (not too far in future/past)
                 try:
@@ -971,22 +1430,43 @@ class GoogleScraper:
         return None
     
     def fetch_all_article_contents(self) -> None:
-        """Fetch full content for all articles."""
+        """Fetch full content for all articles, loading several concurrently in pooled browsers."""
         logger.info(f"Fetching full content for {len(self.articles)} articles...")
         
-        for i, article in enumerate(self.articles, 1):
-            try:
-                if i % 10 == 0:  # Log every 10th article
-                    logger.info(f"Fetching article {i}/{len(self.articles)}...")
-                article.full_content = self.fetch_article_content(article)
-                time.sleep(0.5)
-            except Exception as e:
-                logger.warning(f"Error fetching content for article {i}: {e}")
-                article.full_content = ""  # Set empty string on error
-                continue
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._fetch_pooled_article_content, article): i
+                       for i, article in enumerate(self.articles, 1)}
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                article = self.articles[i - 1]
+                try:
+                    if done % 10 == 0:  # Log every 10th article
+                        logger.info(f"Fetched article {done}/{len(self.articles)}...")
+                    article.full_content = future.result()
+                except Exception as e:
+                    logger.warning(f"Error fetching content for article {i}: {e}")
+                    article.full_content = ""  # Set empty string on error
         
         logger.info("Finished fetching article contents")
     
+    def _fetch_pooled_article_content(self, article: Article) -> str:
+        """
+        Fetch an article's content, using a browser from the pool if it needs one.
+        
+        Args:
+            article: Article object with URL.
+            
+        Returns:
+            Full article text content.
+        """
+        content_text = self._fetch_content_without_browser(article)
+        if content_text is not None:
+            return content_text
+        
+        with self._worker_driver(warm_up=False) as driver:
+            return self._fetch_browser_content(article, driver)
+    
     def analyze_articles(self) -> None:
         """Analyze articles to extract industries, countries, and attack methods."""
         logger.info("Analyzing articles for industries, countries, and attack methods...")
@@ -996,11 +1476,8 @@ class GoogleScraper:
                 # Use full content if available, but focus on main body only
                 # Extract main body content (exclude footer/tags/links sections)
                 if article.full_content:
-                    # Split content and take first 80% (likely main body, excluding footer)
-                    content_lines = article.full_content.split('\n')
-                    # Estimate main body - usually first 70-80% of content
-                    main_body_lines = content_lines[:int(len(content_lines) * 0.75)]
-                    main_body = '\n'.join(main_body_lines)
+                    # Lowercase once; keyword matching below expects lowercased text
+                    main_body = _main_body(article.full_content).lower()
                     # Remove lines that are mostly links or very short (likely tags/footers)
                     filtered_lines = []
                     for line in main_body.split('\n'):
@@ -1008,22 +1485,17 @@ class GoogleScraper:
                         if len(line) < 3:  # Skip very short lines
                             continue
                         # Skip lines that are mostly links (more than 30% of line is link-like)
-                        if 'http' in line.lower() or line.count('/') > 3:
+                        if 'http' in line or line.count('/') > 3:
                             continue
                         filtered_lines.append(line)
                     main_body = ' '.join(filtered_lines)
-                    text = f"{article.title} {main_body}".lower()
+                    text = f"{article.title.lower()} {main_body}"
                 else:
                     text = f"{article.title} {article.snippet}".lower()
                 
-                # Extract industries
-                article.industries = self._extract_industries(text)
-                
-                # Extract countries and count mentions
-                article.countries, article.country_mentions = self._extract_countries_with_counts(text)
-                
-                # Determine attack method
-                article.attack_method = self._determine_attack_method(text)
+                # Extract industries, countries, country mention counts and attack method
+                (article.industries, article.countries,
+                 article.country_mentions, article.attack_method) = self._match_keywords(text)
             except Exception as e:
                 logger.warning(f"Error analyzing article {i} ({article.title[:50]}...): {e}")
                 # Ensure defaults are set
@@ -1037,21 +1509,77 @@ class GoogleScraper:
         
         logger.info(f"Analysis complete for {len(self.articles)} articles.")
     
+    def _match_keywords(self, text: str) -> Tuple[List[str], List[str], Dict[str, int], str]:
+        """
+        Extract industries, countries and attack method from text in a single Aho-Corasick pass.
+        
+        Falls back to the per-category extractors if pyahocorasick is not installed.
+        
+        Args:
+            text: Lowercased text to analyze.
+            
+        Returns:
+            Tuple of (industry names, unique country names, dict of country mention counts,
+            'direct'/'proxy'/'unknown' attack method).
+        """
+        if self._KEYWORD_AUTOMATON is None:
+            industries = self._extract_industries(text)
+            countries, country_mentions = self._extract_countries_with_counts(text)
+            return industries, countries, country_mentions, self._determine_attack_method(text)
+        
+        found_industries = set()
+        country_hits = []  # (start, end, country keyword)
+        attack_keywords = defaultdict(set)  # Distinct keywords found per attack method
+        
+        for end, (keyword, tags) in self._KEYWORD_AUTOMATON.iter(text):
+            start = end - len(keyword) + 1
+            for category, value in tags:
+                if category == 'industry':
+                    found_industries.add(value)
+                elif category == 'attack':
+                    attack_keywords[value].add(keyword)
+                # Countries need word boundaries to avoid matching "russia" in "russian"
+                elif _is_whole_word(text, start, end + 1):
+                    country_hits.append((start, end + 1, value))
+        
+        # Count countries like COUNTRY_RE would: leftmost-longest, without overlaps,
+        # so "czech republic" isn't also counted as "czech"
+        counted = []
+        last_end = 0
+        for start, end, country in sorted(country_hits, key=lambda hit: (hit[0], -hit[1])):
+            if start >= last_end:
+                counted.append(country)
+                last_end = end
+        country_counts = Counter(counted)
+        
+        # Keep industries in INDUSTRY_KEYWORDS order
+        industries = [industry for industry in self.INDUSTRY_KEYWORDS if industry in found_industries]
+        
+        # Normalize country names, merging aliases (e.g. 'uk' and 'britain')
+        country_mentions = Counter()
+        for country, count in country_counts.items():
+            country_mentions[self._normalize_country_name(country)] += count
+        
+        attack_method = self._classify_attack_method(len(attack_keywords['direct']), len(attack_keywords['proxy']))
+        
+        # Plain dict: dataclasses.asdict() does not round-trip Counter
+        return industries, list(country_mentions), dict(country_mentions), attack_method
+    
     def _extract_industries(self, text: str) -> List[str]:
         """
         Extract affected industries from text.
         
         Args:
-            text: Text to analyze.
+            text: Lowercased text to analyze.
             
         Returns:
             List of industry names found.
         """
         found_industries = []
         
-        for industry, keywords in self.INDUSTRY_KEYWORDS.items():
+        for industry, keywords in self.INDUSTRY_KEYWORDS_FS.items():
             for keyword in keywords:
-                if keyword.lower() in text:
+                if keyword in text:
                     found_industries.append(industry)
                     break
         
@@ -1062,64 +1590,33 @@ class GoogleScraper:
         Extract mentioned countries from text using word boundaries.
         
         Args:
-            text: Text to analyze.
+            text: Lowercased text to analyze.
             
         Returns:
             List of country names found.
         """
-        found_countries = []
-        text_lower = text.lower()
-        
-        # Sort countries by length (longest first) to avoid partial matches
-        sorted_countries = sorted(self.COUNTRY_KEYWORDS, key=len, reverse=True)
-        
-        for country in sorted_countries:
-            country_lower = country.lower()
-            # Use word boundaries to avoid matching "russia" in "russian"
-            # Match whole words or at word boundaries
-            pattern = r'\b' + re.escape(country_lower) + r'\b'
-            if re.search(pattern, text_lower):
-                # Normalize country names
-                normalized = self._normalize_country_name(country)
-                if normalized not in found_countries:
-                    found_countries.append(normalized)
-        
-        return found_countries
+        countries, _ = self._extract_countries_with_counts(text)
+        return countries
     
     def _extract_countries_with_counts(self, text: str) -> Tuple[List[str], Dict[str, int]]:
         """
         Extract mentioned countries from text and count all instances.
         
         Args:
-            text: Text to analyze.
+            text: Lowercased text to analyze.
             
         Returns:
             Tuple of (list of unique country names, dict of country mention counts).
         """
-        found_countries = []
-        country_mentions = {}
-        text_lower = text.lower()
-        
-        # Sort countries by length (longest first) to avoid partial matches
-        sorted_countries = sorted(self.COUNTRY_KEYWORDS, key=len, reverse=True)
+        # One scan; word boundaries avoid matching "russia" in "russian"
+        country_counts = Counter(self.COUNTRY_RE.findall(text))
         
-        for country in sorted_countries:
-            country_lower = country.lower()
-            # Use word boundaries to avoid matching "russia" in "russian"
-            pattern = r'\b' + re.escape(country_lower) + r'\b'
-            matches = re.findall(pattern, text_lower)
-            
-            if matches:
-                # Normalize country names
-                normalized = self._normalize_country_name(country)
-                # Count all mentions
-                count = len(matches)
-                country_mentions[normalized] = country_mentions.get(normalized, 0) + count
-                
-                if normalized not in found_countries:
-                    found_countries.append(normalized)
+        # Normalize country names and count all mentions
+        country_mentions = Counter()
+        for country, count in country_counts.items():
+            country_mentions[self._normalize_country_name(country)] += count
         
-        return found_countries, country_mentions
+        return list(country_mentions), dict(country_mentions)
     
     def _normalize_country_name(self, country: str) -> str:
         """
@@ -1131,63 +1628,35 @@ class GoogleScraper:
         Returns:
             Normalized country name.
         """
-        mapping = {
-            'uk': 'United Kingdom',
-            'britain': 'United Kingdom',
-            'gb': 'United Kingdom',
-            'great britain': 'United Kingdom',
-            'england': 'United Kingdom',
-            'britain': 'United Kingdom',
-            'ukraine': 'Ukraine',
-            'poland': 'Poland',
-            'germany': 'Germany',
-            'france': 'France',
-            'estonia': 'Estonia',
-            'latvia': 'Latvia',
-            'lithuania': 'Lithuania',
-            'czech': 'Czech Republic',
-            'czechia': 'Czech Republic',
-            'czech republic': 'Czech Republic',
-            'slovakia': 'Slovakia',
-            'romania': 'Romania',
-            'bulgaria': 'Bulgaria',
-            'finland': 'Finland',
-            'sweden': 'Sweden',
-            'norway': 'Norway',
-            'denmark': 'Denmark',
-            'netherlands': 'Netherlands',
-            'belgium': 'Belgium',
-            'spain': 'Spain',
-            'italy': 'Italy',
-            'greece': 'Greece',
-            'portugal': 'Portugal',
-            'moldova': 'Moldova',
-            'luxembourg': 'Luxembourg',
-            'hungary': 'Hungary'
-        }
-        
-        country_lower = country.lower()
-        for key, value in mapping.items():
-            if key == country_lower or key in country_lower:
-                return value
-        
-        return country.title()
+        return self._COUNTRY_NORM.get(country.lower()) or country.title()
     
     def _determine_attack_method(self, text: str) -> str:
         """
         Determine if attack was direct or by proxy.
         
         Args:
-            text: Text to analyze.
+            text: Lowercased text to analyze.
             
         Returns:
             'direct', 'proxy', or 'unknown'.
         """
-        text_lower = text.lower()
+        direct_score = sum(1 for keyword in self.SECURITY_SERVICES_FS['direct'] if keyword in text)
+        proxy_score = sum(1 for keyword in self.SECURITY_SERVICES_FS['proxy'] if keyword in text)
         
-        direct_score = sum(1 for keyword in self.SECURITY_SERVICES['direct'] if keyword in text_lower)
-        proxy_score = sum(1 for keyword in self.SECURITY_SERVICES['proxy'] if keyword in text_lower)
+        return self._classify_attack_method(direct_score, proxy_score)
+    
+    @staticmethod
+    def _classify_attack_method(direct_score: int, proxy_score: int) -> str:
+        """
+        Pick the attack method with more distinct keyword hits.
         
+        Args:
+            direct_score: Number of distinct direct (security service) keywords found.
+            proxy_score: Number of distinct proxy keywords found.
+            
+        Returns:
+            'direct', 'proxy', or 'unknown'.
+        """
         if direct_score > proxy_score:
             return 'direct'
         elif proxy_score > direct_score:
@@ -1202,14 +1671,22 @@ class GoogleScraper:
         Args:
             filename: Output filename.
         """
-        data = {
-            'articles': [asdict(article) for article in self.articles],
-            'total_count': len(self.articles),
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson serializes dataclasses natively, so asdict() isn't needed
+            encode_article = orjson.dumps
+        else:
+            encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+            def encode_article(article: Article) -> bytes:
+                return encoder.encode(asdict(article)).encode('utf-8')
+        
+        # Write one article at a time instead of serializing the whole result set in memory
+        with open(filename, 'wb') as f:
+            f.write(b'{"articles":[')
+            for i, article in enumerate(self.articles):
+                if i:
+                    f.write(b',')
+                f.write(encode_article(article))
+            f.write(f'],"total_count":{len(self.articles)},"timestamp":"{datetime.now().isoformat()}"}}'.encode())
         
         logger.info(f"Results saved to {filename}")
     
@@ -1220,8 +1697,12 @@ class GoogleScraper:
         Args:
             filename: Input filename.
         """
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(filename, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         self.articles = [Article(**article) for article in data['articles']]
         logger.info(f"Loaded {len(self.articles)} articles from {filename}")
@@ -1248,24 +1729,20 @@ class GoogleScraper:
                 'Attack Method'
             ])
             
-            # Write data rows
-            for article in self.articles:
-                # Format country mentions as "Country: Count, Country: Count"
-                country_mentions_str = ', '.join([
-                    f"{country}: {count}" 
-                    for country, count in article.country_mentions.items()
-                ]) if article.country_mentions else ''
-                
-                writer.writerow([
+            # Write data rows in one call; country mentions as "Country: Count, Country: Count"
+            writer.writerows(
+                (
                     article.title,
                     article.url,
                     article.date or '',
                     article.snippet,
-                    ', '.join(article.industries) if article.industries else '',
-                    ', '.join(article.countries) if article.countries else '',
-                    country_mentions_str,
+                    ', '.join(article.industries or ()),
+                    ', '.join(article.countries or ()),
+                    ', '.join(f"{country}: {count}" for country, count in (article.country_mentions or {}).items()),
                     article.attack_method or 'unknown'
-                ])
+                )
+                for article in self.articles
+            )
         
         logger.info(f"Results exported to {filename}")
     
@@ -1276,22 +1753,20 @@ class GoogleScraper:
         Args:
             filename: Output text filename.
         """
-        unknown_articles = []
-        
-        for article in self.articles:
-            method = (article.attack_method or 'unknown').lower()
-            # Include only articles that are not 'direct' or 'proxy'
-            if method not in ['direct', 'proxy']:
-                unknown_articles.append(article.url)
+        # Include only articles that are not 'direct' or 'proxy'
+        unknown_articles = [
+            article.url for article in self.articles
+            if (article.attack_method or 'unknown').lower() not in ('direct', 'proxy')
+        ]
         
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("Articles with Unknown/Other Attack Methods\n")
-            f.write("=" * 60 + "\n")
-            f.write(f"Total: {len(unknown_articles)} articles\n")
-            f.write("=" * 60 + "\n\n")
-            
-            for i, url in enumerate(unknown_articles, 1):
-                f.write(f"{i}. {url}\n")
+            f.write(
+                "Articles with Unknown/Other Attack Methods\n"
+                + "=" * 60 + "\n"
+                + f"Total: {len(unknown_articles)} articles\n"
+                + "=" * 60 + "\n\n"
+            )
+            f.writelines(f"{i}. {url}\n" for i, url in enumerate(unknown_articles, 1))
         
         logger.info(f"Exported {len(unknown_articles)} unknown/other articles to {filename}")
 
@@ -1299,6 +1774,125 @@ class GoogleScraper:
 class DataVisualizer:
     """Handles data visualization using matplotlib."""
     
+    # Industry keywords whose incidence is plotted (a broader list than GoogleScraper.INDUSTRY_KEYWORDS),
+    # read-only so the patterns and automaton built from it below cannot go stale
+    INDUSTRY_KEYWORDS = MappingProxyType({
+        'energy': (
+            'power grid', 'electricity transmission', 'high voltage substation', 'transformer',
+            'switchgear', 'grid operator', 'power plant', 'gas-fired plant', 'substation',
+            'nuclear plant', 'hydropower dam', 'wind farm', 'solar farm',
+            'gas pipeline', 'compressor station', 'LNG terminal', 'oil refinery',
+            'fuel depot', 'storage tank', 'pumping station', 'heating',
+            'blackout', 'grid failure', 'SCADA', 'ICS', 'power outage'
+        ),
+        'transportation': (
+            'railway', 'rail line', 'freight train',
+            'rail yard', 'marshalling yard',
+            'rail signalling', 'signal box',
+            'switch points', 'interlocking',
+            'derailment', 'track sabotage',
+            'bridge', 'tunnel', 'port', 'pier', 'terminal',
+            'container terminal',
+            'logistics hub', 'distribution hub',
+            'fuel pipeline', 'airport',
+            'runway', 'air traffic control',
+            'fire at depot', 'explosion',
+        ),
+        'telecommunications': (
+            'telecom exchange', 'telephone exchange',
+            'mobile network', 'cell tower',
+            'base station', 'core network',
+            'network operations centre', 'data centre',
+            'fiber-optic cable', 'fibre-optic cable',
+            'undersea cable', 'subsea cable',
+            'cable landing station', 'backbone network',
+            'microwave link', 'satellite link',
+            'routing outage', 'BGP hijack',
+            'cable cut', 'network disruption'
+        ),
+        'finance': (
+            'bank', 'central bank', 'payment system',
+            'SWIFT', 'SEPA', 'clearing house',
+            'ATM network', 'cash-in-transit',
+            'bank branch', 'vault',
+            'financial regulator', 'sanctions enforcement',
+            'sanctions evasion', 'money laundering',
+            'financial cyberattack', 'DDoS extortion',
+            'data breach', 'ransom payment',
+            'crypto exchange', 'illicit finance',
+            'state-sponsored attack', 'insider threat'
+        ),
+        'healthcare': (
+            'hospital', 'medical centre', 'emergency department',
+            'ambulance service', 'medical supply depot',
+            'pharmaceutical plant', 'vaccine facility',
+            'laboratory', 'pathology lab', 'biomedical facility',
+            'oxygen supply', 'medical gas', 'power outage hospital',
+            'backup generator failure', 'hospital ransomware',
+            'health data breach', 'medical logistics',
+            'cold chain disruption', 'water contamination',
+            'fire evacuation', 'security incident'
+        ),
+        'defense': (
+            'military base', 'airbase', 'naval base', 'barracks',
+            'munitions depot', 'ammo depot', 'weapons storage',
+            'fuel depot', 'jet fuel', 'military logistics',
+            'weapons shipment', 'military convoy', 'rail transport military',
+            'radar site', 'air defence', 'missile system',
+            'drone', 'UAV', 'military aircraft', 'arms factory',
+            'restricted area', 'secure facility', 'perimeter breach',
+            'explosive device', 'military attack',
+            'covert reconnaissance', 'military sabotage'
+        ),
+        'cybersecurity': (
+            'cyber sabotage', 'wiper malware', 'ransomware', 'DDoS',
+            'network intrusion', 'unauthorized access', 'supply chain attack',
+            'OT compromise', 'ICS compromise', 'SCADA breach', 'industrial control system',
+            'PLC manipulation', 'remote access trojan', 'command and control',
+            'APT', 'state-sponsored', 'cyber espionage', 'cyber disruption',
+            'satellite communications attack', 'router compromise',
+            'telecom network intrusion', 'energy sector cyberattack',
+            'transport sector cyberattack', 'data wiper', 'system outage',
+            'incident response', 'attribution'
+        ),
+        'manufacturing': (
+            'industrial plant', 'factory', 'production facility', 'industrial site',
+            'chemical plant', 'petrochemical', 'fertilizer plant', 'explosives plant',
+            'ammunition factory', 'drone factory', 'aerospace plant',
+            'shipyard', 'railcar factory', 'machinery plant', 'transformer factory',
+            'cable factory', 'electronics plant', 'warehouse', 'logistics depot',
+            'distribution centre', 'industrial fire',
+            'production halt', 'supply chain disruption'
+        ),
+        'government': (
+            'government building', 'ministry', 'defence ministry', 'interior ministry',
+            'foreign ministry', 'state agency', 'regulatory authority', 'municipal building',
+            'city hall', 'prefecture', 'embassy', 'consulate', 'diplomatic mission',
+            'border police', 'border guard', 'customs service', 'national police',
+            'gendarmerie', 'security service', 'intelligence service', 'counterintelligence',
+            'civil protection', 'emergency management', 'critical infrastructure authority',
+            'classified facility', 'secure compound', 'perimeter breach'
+        ),
+    })
+    
+    # Map from a lowercased match back to the keyword as listed
+    _KEYWORD_BY_MATCH = {keyword.lower(): keyword for keywords in INDUSTRY_KEYWORDS.values() for keyword in keywords}
+    
+    # One longest-first whole-word alternation per industry, used when pyahocorasick is not installed.
+    # Keywords listed under several industries are counted once per listing
+    _INDUSTRY_KEYWORD_PATTERNS = [
+        re.compile(r'\b(' + '|'.join(
+            re.escape(keyword.lower()) for keyword in sorted(keywords, key=len, reverse=True)
+        ) + r')\b')
+        for keywords in INDUSTRY_KEYWORDS.values()
+    ]
+    
+    # Single automaton over all keywords, built once at class load (None without pyahocorasick)
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(INDUSTRY_KEYWORDS, set(), {})
+    
+    # Fewest article texts per worker process for the keyword scan to outweigh process startup
+    _MIN_TEXTS_PER_WORKER = 100
+    
     def __init__(self, articles: List[Article]):
         """
         Initialize visualizer with articles.
@@ -1307,6 +1901,145 @@ class DataVisualizer:
             articles: List of Article objects to visualize.
         """
         self.articles = articles
+        
+        # Per-category tallies shared by several plots, computed once
+        self._industry_counts = Counter(industry for article in articles for industry in article.industries)
+        self._country_counts = Counter(country for article in articles for country in article.countries)
+        self._method_counts = Counter(article.attack_method for article in articles)
+        self._country_mentions = Counter()
+        for article in articles:
+            self._country_mentions.update(article.country_mentions)
+    
+    def _article_dates(self) -> np.ndarray:
+        """
+        Get all valid article dates as one datetime64 array.
+        
+        Returns:
+            datetime64[D] array of article dates (missing or invalid dates dropped).
+        """
+        dates = [article.date for article in self.articles if article.date]
+        try:
+            # Vectorized parse; fails as a whole if any date is malformed
+            return np.array(dates, dtype='datetime64[D]')
+        except ValueError:
+            valid = []
+            for date in dates:
+                try:
+                    valid.append(np.datetime64(date, 'D'))
+                except ValueError:
+                    continue
+            return np.array(valid, dtype='datetime64[D]')
+    
+    @cached_property
+    def _year_counts(self) -> List[int]:
+        """
+        Get the number of articles per year for 2020-2026, counted once per visualizer.
+        
+        Returns:
+            List of 7 article counts, one per year from 2020 to 2026 (0 for years without articles).
+        """
+        # datetime64[Y] counts years since 1970
+        years = self._article_dates().astype('datetime64[Y]').astype(int) + 1970
+        years = years[(years >= 2020) & (years <= 2026)]
+        return np.bincount(years - 2020, minlength=7).tolist()
+    
+    @cached_property
+    def _method_chart_data(self) -> Tuple[List[str], List[int], List[str], List[str]]:
+        """
+        Get the attack method series shared by the attack method charts, built once per visualizer.
+        
+        Returns:
+            Tuple of (attack methods, article counts, bar/wedge colors, pie labels with percentages).
+        """
+        methods = list(self._method_counts.keys())
+        counts = list(self._method_counts.values())
+        
+        colors = {'direct': 'red', 'proxy': 'orange', 'unknown': 'gray'}
+        method_colors = [colors.get(m, 'blue') for m in methods]
+        
+        # Percentages are formatted once here instead of by an autopct callback per wedge
+        total = sum(counts)
+        pie_labels = [f"{method} ({count / total:.1%})" for method, count in zip(methods, counts)]
+        
+        return methods, counts, method_colors, pie_labels
+    
+    @cached_property
+    def _keyword_texts(self) -> List[str]:
+        """
+        Get the lowercased text of each article searched for keywords, built once per visualizer.
+        
+        Returns:
+            Title, snippet and main body (first 75% of full content, to exclude footer/tags)
+            of each article, lowercased.
+        """
+        return [
+            f"{article.title} {article.snippet} {_main_body(article.full_content)}".lower()
+            if article.full_content else f"{article.title} {article.snippet}".lower()
+            for article in self.articles
+        ]
+    
+    @classmethod
+    def _count_industry_keywords(cls, texts: Iterable[str]) -> Counter:
+        """
+        Count INDUSTRY_KEYWORDS occurrences across a batch of texts, one Aho-Corasick pass per text.
+        
+        Falls back to one alternation regex per industry if pyahocorasick is not installed.
+        
+        Args:
+            texts: Lowercased texts to analyze.
+            
+        Returns:
+            Counter of keyword (as listed in INDUSTRY_KEYWORDS) to total number of occurrences.
+        """
+        keyword_counts = Counter()
+        keyword_by_match = cls._KEYWORD_BY_MATCH
+        
+        for text in texts:
+            if cls._KEYWORD_AUTOMATON is None:
+                for pattern in cls._INDUSTRY_KEYWORD_PATTERNS:
+                    keyword_counts.update(map(keyword_by_match.__getitem__, pattern.findall(text)))
+                continue
+            
+            hits = []  # (start, end, industry, keyword)
+            for end, (keyword, tags) in cls._KEYWORD_AUTOMATON.iter(text):
+                start = end - len(keyword) + 1
+                if _is_whole_word(text, start, end + 1):
+                    for _, industry in tags:
+                        hits.append((start, end + 1, industry, keyword))
+            
+            # Count like the per-industry regexes would: leftmost-longest, without overlaps within an industry
+            counted = []
+            last_end = defaultdict(int)
+            for start, end, industry, keyword in sorted(hits, key=lambda hit: (hit[0], -hit[1])):
+                if start >= last_end[industry]:
+                    counted.append(keyword)
+                    last_end[industry] = end
+            keyword_counts.update(map(keyword_by_match.__getitem__, counted))
+        
+        return keyword_counts
+    
+    def _scan_keyword_texts(self) -> Counter:
+        """
+        Count INDUSTRY_KEYWORDS occurrences across all articles, sharded over a process pool
+        when there are enough articles to make it worthwhile.
+        
+        Returns:
+            Counter of keyword (as listed in INDUSTRY_KEYWORDS) to total number of occurrences.
+        """
+        texts = self._keyword_texts
+        workers = min(os.cpu_count() or 1, len(texts) // self._MIN_TEXTS_PER_WORKER)
+        if workers < 2:
+            return self._count_industry_keywords(texts)
+        
+        # Contiguous chunks, merged in order, keep keywords in first-seen order for most_common() ties
+        chunk_size = -(-len(texts) // workers)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        
+        keyword_counts = Counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial_counts in executor.map(_count_industry_keywords_chunk, chunks):
+                keyword_counts.update(partial_counts)
+        return keyword_counts
     
     def create_all_visualizations(self, output_dir: str = "visualizations") -> None:
         """
@@ -1336,30 +2069,18 @@ class DataVisualizer:
         Args:
             output_dir: Output directory.
         """
-        # Group articles by month
-        monthly_counts = defaultdict(int)
-        
-        for article in self.articles:
-            if article.date:
-                try:
-                    date_obj = datetime.strptime(article.date, '%Y-%m-%d')
-                    month_key = date_obj.strftime('%Y-%m')
-                    monthly_counts[month_key] += 1
-                except ValueError:
-                    continue
+        # Group articles by month (np.unique returns the months sorted)
+        months, counts = np.unique(self._article_dates().astype('datetime64[M]'), return_counts=True)
         
-        if not monthly_counts:
+        if not len(months):
             logger.warning("No date information available for timeline visualization.")
             return
         
-        # Sort by date
-        sorted_months = sorted(monthly_counts.items())
-        months = [datetime.strptime(m, '%Y-%m') for m, _ in sorted_months]
-        counts = [c for _, c in sorted_months]
+        months = months.astype('datetime64[D]')
         
-        fig, ax = plt.subplots(figsize=(14, 6))
+        fig, ax = plt.subplots(figsize=(14, 6), constrained_layout=True)
         
-        if months and counts:
+        if len(months):
             ax.plot(months, counts, marker='o', linewidth=2, markersize=6)
             ax.fill_between(months, counts, alpha=0.3)
             
@@ -1385,8 +2106,8 @@ class DataVisualizer:
         plt.xticks(rotation=45)
         
         # Add date range info
-        if months:
-            date_range = f"Date Range: {months[0].strftime('%Y-%m')} to {months[-1].strftime('%Y-%m')}"
+        if len(months):
+            date_range = f"Date Range: {str(months[0])[:7]} to {str(months[-1])[:7]}"
             ax.text(0.02, 0.98, date_range, transform=ax.transAxes, 
                    fontsize=9, verticalalignment='top', 
                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
@@ -1396,9 +2117,8 @@ class DataVisualizer:
                    transform=ax.transAxes, ha='center', va='center',
                    fontsize=12, style='italic')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/timeline_by_month.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(f"{output_dir}/timeline_by_month.png", dpi=_FIG_DPI)
+        plt.close(fig)
         logger.info("Timeline by month saved")
     
     def plot_timeline_by_year(self, output_dir: str) -> None:
@@ -1408,33 +2128,17 @@ class DataVisualizer:
         Args:
             output_dir: Output directory.
         """
-        yearly_counts = defaultdict(int)
-        
-        for article in self.articles:
-            if article.date:
-                try:
-                    date_obj = datetime.strptime(article.date, '%Y-%m-%d')
-                    year = date_obj.year
-                    yearly_counts[year] += 1
-                except ValueError:
-                    continue
-        
         # Ensure we have data for all years 2020-2026, even if count is 0
         all_years = list(range(2020, 2027))
-        counts = [yearly_counts.get(year, 0) for year in all_years]
+        counts = self._year_counts
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
         
         if any(counts):  # Only plot if there's data
             bars = ax.bar(all_years, counts, color='steelblue', alpha=0.7, edgecolor='black', linewidth=1.5)
             
-            # Add value labels on bars with dates
-            for bar, year, count in zip(bars, all_years, counts):
-                if count > 0:  # Only label non-zero bars
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{int(height)}',
-                           ha='center', va='bottom', fontweight='bold')
+            # Add value labels on bars with dates (only non-zero bars)
+            ax.bar_label(bars, labels=[f'{int(count)}' if count > 0 else '' for count in counts], fontweight='bold')
         else:
             # Show message if no data
             ax.text(0.5, 0.5, 'No date data available', 
@@ -1456,9 +2160,8 @@ class DataVisualizer:
                fontsize=9, verticalalignment='top', 
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/timeline_by_year.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(f"{output_dir}/timeline_by_year.png", dpi=_FIG_DPI)
+        plt.close(fig)
         logger.info("Timeline by year saved")
     
     def plot_industries_affected(self, output_dir: str) -> None:
@@ -1468,40 +2171,28 @@ class DataVisualizer:
         Args:
             output_dir: Output directory.
         """
-        industry_counts = Counter()
-        
-        for article in self.articles:
-            for industry in article.industries:
-                industry_counts[industry] += 1
+        industry_counts = self._industry_counts
         
         if not industry_counts:
             logger.warning("No industry data available")
             return
         
-        industries = list(industry_counts.keys())
-        counts = list(industry_counts.values())
-        
         # Sort by count
-        sorted_data = sorted(zip(industries, counts), key=lambda x: x[1], reverse=True)
-        industries, counts = zip(*sorted_data)
+        industries, counts = zip(*industry_counts.most_common())
         
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8), constrained_layout=True)
         bars = ax.barh(industries, counts, color='crimson', alpha=0.7, edgecolor='black', linewidth=1.5)
         
         # Add value labels
-        for i, (bar, count) in enumerate(zip(bars, counts)):
-            ax.text(count, bar.get_y() + bar.get_height()/2.,
-                   f' {count}',
-                   ha='left', va='center', fontweight='bold')
+        ax.bar_label(bars, padding=3, fontweight='bold')
         
         ax.set_xlabel('Number of Articles', fontsize=12, fontweight='bold')
         ax.set_ylabel('Industry', fontsize=12, fontweight='bold')
         ax.set_title('Industries Affected by Russian Sabotage', fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='x')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/industries_affected.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(f"{output_dir}/industries_affected.png", dpi=_FIG_DPI)
+        plt.close(fig)
         logger.info("Industries affected saved")
     
     def plot_industry_keywords_incidence(self, output_dir: str) -> None:
@@ -1511,129 +2202,8 @@ class DataVisualizer:
         Args:
             output_dir: Output directory.
         """
-        # Define industry keywords (same as in GoogleScraper)
-        INDUSTRY_KEYWORDS = {
-            'energy': [
-                'power grid', 'electricity transmission', 'high voltage substation', 'transformer',
-                'switchgear', 'grid operator', 'power plant', 'gas-fired plant', 'substation',
-                'nuclear plant', 'hydropower dam', 'wind farm', 'solar farm',
-                'gas pipeline', 'compressor station', 'LNG terminal', 'oil refinery',
-                'fuel depot', 'storage tank', 'pumping station', 'heating',
-                'blackout', 'grid failure', 'SCADA', 'ICS', 'power outage'
-            ],
-            'transportation': [
-                'railway', 'rail line', 'freight train',
-                'rail yard', 'marshalling yard',
-                'rail signalling', 'signal box',
-                'switch points', 'interlocking',
-                'derailment', 'track sabotage',
-                'bridge', 'tunnel', 'port', 'pier', 'terminal',
-                'container terminal',
-                'logistics hub', 'distribution hub',
-                'fuel pipeline', 'airport',
-                'runway', 'air traffic control',
-                'fire at depot', 'explosion',
-            ],
-            'telecommunications': [
-                'telecom exchange', 'telephone exchange',
-                'mobile network', 'cell tower',
-                'base station', 'core network',
-                'network operations centre', 'data centre',
-                'fiber-optic cable', 'fibre-optic cable',
-                'undersea cable', 'subsea cable',
-                'cable landing station', 'backbone network',
-                'microwave link', 'satellite link',
-                'routing outage', 'BGP hijack',
-                'cable cut', 'network disruption'
-            ],
-            'finance': [
-                'bank', 'central bank', 'payment system',
-                'SWIFT', 'SEPA', 'clearing house',
-                'ATM network', 'cash-in-transit',
-                'bank branch', 'vault',
-                'financial regulator', 'sanctions enforcement',
-                'sanctions evasion', 'money laundering',
-                'financial cyberattack', 'DDoS extortion',
-                'data breach', 'ransom payment',
-                'crypto exchange', 'illicit finance',
-                'state-sponsored attack', 'insider threat'
-            ],
-            'healthcare': [
-                'hospital', 'medical centre', 'emergency department',
-                'ambulance service', 'medical supply depot',
-                'pharmaceutical plant', 'vaccine facility',
-                'laboratory', 'pathology lab', 'biomedical facility',
-                'oxygen supply', 'medical gas', 'power outage hospital',
-                'backup generator failure', 'hospital ransomware',
-                'health data breach', 'medical logistics',
-                'cold chain disruption', 'water contamination',
-                'fire evacuation', 'security incident'
-            ],
-            'defense': [
-                'military base', 'airbase', 'naval base', 'barracks',
-                'munitions depot', 'ammo depot', 'weapons storage',
-                'fuel depot', 'jet fuel', 'military logistics',
-                'weapons shipment', 'military convoy', 'rail transport military',
-                'radar site', 'air defence', 'missile system',
-                'drone', 'UAV', 'military aircraft', 'arms factory',
-                'restricted area', 'secure facility', 'perimeter breach',
-                'explosive device', 'military attack',
-                'covert reconnaissance', 'military sabotage'
-            ],
-            'cybersecurity': [
-                'cyber sabotage', 'wiper malware', 'ransomware', 'DDoS',
-                'network intrusion', 'unauthorized access', 'supply chain attack',
-                'OT compromise', 'ICS compromise', 'SCADA breach', 'industrial control system',
-                'PLC manipulation', 'remote access trojan', 'command and control',
-                'APT', 'state-sponsored', 'cyber espionage', 'cyber disruption',
-                'satellite communications attack', 'router compromise',
-                'telecom network intrusion', 'energy sector cyberattack',
-                'transport sector cyberattack', 'data wiper', 'system outage',
-                'incident response', 'attribution'
-            ],
-            'manufacturing': [
-                'industrial plant', 'factory', 'production facility', 'industrial site',
-                'chemical plant', 'petrochemical', 'fertilizer plant', 'explosives plant',
-                'ammunition factory', 'drone factory', 'aerospace plant',
-                'shipyard', 'railcar factory', 'machinery plant', 'transformer factory',
-                'cable factory', 'electronics plant', 'warehouse', 'logistics depot',
-                'distribution centre', 'industrial fire',
-                'production halt', 'supply chain disruption'
-            ],
-            'government': [
-                'government building', 'ministry', 'defence ministry', 'interior ministry',
-                'foreign ministry', 'state agency', 'regulatory authority', 'municipal building',
-                'city hall', 'prefecture', 'embassy', 'consulate', 'diplomatic mission',
-                'border police', 'border guard', 'customs service', 'national police',
-                'gendarmerie', 'security service', 'intelligence service', 'counterintelligence',
-                'civil protection', 'emergency management', 'critical infrastructure authority',
-                'classified facility', 'secure compound', 'perimeter breach'
-            ],
-        }
-        
-        # Count keyword occurrences across all articles
-        keyword_counts = Counter()
-        
-        for article in self.articles:
-            # Combine title, snippet, and full content for keyword search
-            text = ""
-            if article.full_content:
-                # Use main body only (first 75% to exclude footer/tags)
-                content_lines = article.full_content.split('\n')
-                main_body_lines = content_lines[:int(len(content_lines) * 0.75)]
-                main_body = '\n'.join(main_body_lines)
-                text = f"{article.title} {article.snippet} {main_body}".lower()
-            else:
-                text = f"{article.title} {article.snippet}".lower()
-            
-            # Count occurrences of each keyword
-            for industry, keywords in INDUSTRY_KEYWORDS.items():
-                for keyword in keywords:
-                    # Count occurrences using word boundaries for better accuracy
-                    pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-                    matches = len(re.findall(pattern, text))
-                    if matches > 0:
-                        keyword_counts[keyword] += matches
+        # Count keyword occurrences across all articles in one batch
+        keyword_counts = self._scan_keyword_texts()
         
         if not keyword_counts:
             logger.warning("No industry keyword data available")
@@ -1643,23 +2213,19 @@ class DataVisualizer:
         top_keywords = keyword_counts.most_common(30)
         keywords, counts = zip(*top_keywords)
         
-        fig, ax = plt.subplots(figsize=(14, 10))
+        fig, ax = plt.subplots(figsize=(14, 10), constrained_layout=True)
         bars = ax.barh(keywords, counts, color='darkorange', alpha=0.7, edgecolor='black', linewidth=1.5)
         
         # Add value labels
-        for bar, count in zip(bars, counts):
-            ax.text(count, bar.get_y() + bar.get_height()/2.,
-                   f' {count}',
-                   ha='left', va='center', fontweight='bold')
+        ax.bar_label(bars, padding=3, fontweight='bold')
         
         ax.set_xlabel('Number of Occurrences', fontsize=12, fontweight='bold')
         ax.set_ylabel('Industry Keyword', fontsize=12, fontweight='bold')
         ax.set_title('Incidence of Industry Keywords in Articles (Top 30)', fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='x')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/industry_keywords_incidence.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(f"{output_dir}/industry_keywords_incidence.png", dpi=_FIG_DPI)
+        plt.close(fig)
         logger.info("Industry keywords incidence saved")
     
     def plot_countries_affected(self, output_dir: str) -> None:
@@ -1669,37 +2235,29 @@ class DataVisualizer:
         Args:
             output_dir: Output directory.
         """
-        country_mention_counts = defaultdict(int)
-        
-        for article in self.articles:
-            for country, count in article.country_mentions.items():
-                country_mention_counts[country] += count
+        country_mention_counts = self._country_mentions
         
         if not country_mention_counts:
             logger.warning("No country data available")
             return
         
         # Get top 15 countries by mention count
-        top_countries = sorted(country_mention_counts.items(), key=lambda x: x[1], reverse=True)[:15]
+        top_countries = country_mention_counts.most_common(15)
         countries, counts = zip(*top_countries)
         
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8), constrained_layout=True)
         bars = ax.barh(countries, counts, color='darkgreen', alpha=0.7, edgecolor='black', linewidth=1.5)
         
         # Add value labels
-        for bar, count in zip(bars, counts):
-            ax.text(count, bar.get_y() + bar.get_height()/2.,
-                   f' {count}',
-                   ha='left', va='center', fontweight='bold')
+        ax.bar_label(bars, padding=3, fontweight='bold')
         
         ax.set_xlabel('Number of Articles', fontsize=12, fontweight='bold')
         ax.set_ylabel('Country', fontsize=12, fontweight='bold')
         ax.set_title('Countries Mentioned in Russian Sabotage Articles (Top 15)', fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='x')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/countries_affected.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(f"{output_dir}/countries_affected.png", dpi=_FIG_DPI)
+        plt.close(fig)
         logger.info("Countries affected saved")
     
     def plot_attack_methods(self, output_dir: str) -> None:
@@ -1709,38 +2267,25 @@ class DataVisualizer:
         Args:
             output_dir: Output directory.
         """
-        method_counts = Counter()
-        
-        for article in self.articles:
-            method_counts[article.attack_method] += 1
+        methods, counts, method_colors, pie_labels = self._method_chart_data
         
-        methods = list(method_counts.keys())
-        counts = list(method_counts.values())
-        
-        colors = {'direct': 'red', 'proxy': 'orange', 'unknown': 'gray'}
-        method_colors = [colors.get(m, 'blue') for m in methods]
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6), constrained_layout=True)
         
         # Pie chart
-        ax1.pie(counts, labels=methods, autopct='%1.1f%%', startangle=90, colors=method_colors)
+        ax1.pie(counts, labels=pie_labels, startangle=90, colors=method_colors)
         ax1.set_title('Attack Method Distribution', fontsize=12, fontweight='bold')
         
         # Bar chart
         bars = ax2.bar(methods, counts, color=method_colors, alpha=0.7, edgecolor='black', linewidth=1.5)
-        for bar, count in zip(bars, counts):
-            ax2.text(bar.get_x() + bar.get_width()/2., count,
-                    f'{count}',
-                    ha='center', va='bottom', fontweight='bold')
+        ax2.bar_label(bars, fontweight='bold')
         
         ax2.set_xlabel('Attack Method', fontsize=12, fontweight='bold')
         ax2.set_ylabel('Number of Articles', fontsize=12, fontweight='bold')
         ax2.set_title('Attack Method Counts', fontsize=12, fontweight='bold')
         ax2.grid(True, alpha=0.3, axis='y')
         
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/attack_methods.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(f"{output_dir}/attack_methods.png", dpi=_FIG_DPI)
+        plt.close(fig)
         logger.info("Attack methods saved")
     
     def plot_combined_analysis(self, output_dir: str) -> None:
@@ -1755,26 +2300,14 @@ class DataVisualizer:
         
         # 1. Timeline by year
         ax1 = fig.add_subplot(gs[0, :])
-        yearly_counts = defaultdict(int)
-        for article in self.articles:
-            if article.date:
-                try:
-                    year = datetime.strptime(article.date, '%Y-%m-%d').year
-                    yearly_counts[year] += 1
-                except ValueError:
-                    continue
-        
         # Ensure we have data for all years 2020-2026
         all_years = list(range(2020, 2027))
-        counts = [yearly_counts.get(year, 0) for year in all_years]
+        counts = self._year_counts
         
         if any(counts):  # Only plot if there's data
             bars = ax1.bar(all_years, counts, color='steelblue', alpha=0.7, edgecolor='black')
-            # Add value labels
-            for bar, year, count in zip(bars, all_years, counts):
-                if count > 0:
-                    ax1.text(bar.get_x() + bar.get_width()/2., count,
-                            f'{count}', ha='center', va='bottom', fontsize=8)
+            # Add value labels (only non-zero bars)
+            ax1.bar_label(bars, labels=[f'{count}' if count > 0 else '' for count in counts], fontsize=8)
         else:
             ax1.text(0.5, 0.5, 'No date data available', 
                     transform=ax1.transAxes, ha='center', va='center',
@@ -1793,11 +2326,7 @@ class DataVisualizer:
         
         # 2. Top industries
         ax2 = fig.add_subplot(gs[1, 0])
-        industry_counts = Counter()
-        for article in self.articles:
-            for industry in article.industries:
-                industry_counts[industry] += 1
-        
+        industry_counts = self._industry_counts
         if industry_counts:
             top_industries = industry_counts.most_common(8)
             industries, counts = zip(*top_industries)
@@ -1808,11 +2337,7 @@ class DataVisualizer:
         
         # 3. Top countries
         ax3 = fig.add_subplot(gs[1, 1])
-        country_counts = Counter()
-        for article in self.articles:
-            for country in article.countries:
-                country_counts[country] += 1
-        
+        country_counts = self._country_counts
         if country_counts:
             top_countries = country_counts.most_common(8)
             countries, counts = zip(*top_countries)
@@ -1823,12 +2348,9 @@ class DataVisualizer:
         
         # 4. Attack methods
         ax4 = fig.add_subplot(gs[2, 0])
-        method_counts = Counter(article.attack_method for article in self.articles)
-        methods = list(method_counts.keys())
-        counts = list(method_counts.values())
-        colors = {'direct': 'red', 'proxy': 'orange', 'unknown': 'gray'}
-        method_colors = [colors.get(m, 'blue') for m in methods]
-        ax4.pie(counts, labels=methods, autopct='%1.1f%%', colors=method_colors, startangle=90)
+        method_counts = self._method_counts
+        _, counts, method_colors, pie_labels = self._method_chart_data
+        ax4.pie(counts, labels=pie_labels, colors=method_colors, startangle=90)
         ax4.set_title('Attack Methods', fontweight='bold')
         
         # 5. Summary statistics
@@ -1839,8 +2361,8 @@ class DataVisualizer:
         
         Total Articles: {len(self.articles)}
         Articles with Dates: {sum(1 for a in self.articles if a.date)}
-        Unique Industries: {len(set(i for a in self.articles for i in a.industries))}
-        Unique Countries: {len(set(c for a in self.articles for c in a.countries))}
+        Unique Industries: {len(self._industry_counts)}
+        Unique Countries: {len(self._country_counts)}
         
         Attack Methods:
         Direct: {method_counts.get('direct', 0)}
@@ -1853,138 +2375,88 @@ class DataVisualizer:
         fig.suptitle('Russian Sabotage Analysis Dashboard (2020-2026)', 
                     fontsize=16, fontweight='bold', y=0.98)
         
-        plt.savefig(f"{output_dir}/combined_analysis.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(f"{output_dir}/combined_analysis.png", dpi=_DASHBOARD_DPI, bbox_inches='tight')
+        plt.close(fig)
         logger.info("Combined analysis saved")
     
     def export_visualization_data_to_csv(self, filename: str = "visualization_data.csv") -> None:
         """
-        Export visualization data to CSV with article links for each category.
+        Export visualization data to CSV with article links for each category, one row per article.
         
         Args:
             filename: Output CSV filename.
         """
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            writer.writerow([
-                'Category',
-                'Value',
-                'Count',
-                'Article Titles',
-                'Article URLs'
-            ])
-            
-            # Export industries data - use dict with URLs as keys to ensure each article is only added once
-            industry_articles = defaultdict(dict)  # dict[industry][url] = article
-            for article in self.articles:
-                for industry in article.industries:
-                    industry_articles[industry][article.url] = article
+        # Group articles by every category in one pass - use dicts with URLs as keys
+        # to ensure each article is only added once per value
+        industry_articles = defaultdict(dict)  # dict[industry][url] = article
+        country_articles = defaultdict(dict)  # dict[country][url] = article
+        country_total_mentions = defaultdict(int)
+        method_articles = defaultdict(dict)  # dict[method][url] = article
+        yearly_articles = defaultdict(dict)  # dict[year][url] = article
+        monthly_articles = defaultdict(dict)  # dict[month][url] = article
+        
+        for article in self.articles:
+            url = article.url
+            for industry in article.industries:
+                industry_articles[industry][url] = article
+            for country in article.countries:
+                country_articles[country][url] = article
+                if country in article.country_mentions:
+                    country_total_mentions[country] += article.country_mentions[country]
+            method_articles[article.attack_method or 'unknown'][url] = article
+            if article.date and _ISO_DATE_RE.fullmatch(article.date):
+                yearly_articles[int(article.date[:4])][url] = article
+                monthly_articles[article.date[:7]][url] = article
+        
+        def rows():
+            """Yield the CSV rows: header, then one row per article of each industry, country, attack method, year and month."""
+            yield ('Category', 'Value', 'Count', 'Article Title', 'Article URL')
             
+            # Industries
             for industry, articles_dict in sorted(industry_articles.items(), key=lambda x: len(x[1]), reverse=True):
-                articles_list = list(articles_dict.values())
-                titles = ' | '.join([a.title for a in articles_list])
-                urls = ' | '.join([a.url for a in articles_list])
-                writer.writerow([
-                    'Industry',
-                    industry,
-                    len(articles_list),
-                    titles,
-                    urls
-                ])
-            
-            # Export countries data with mention counts
-            country_articles = defaultdict(dict)
-            country_total_mentions = defaultdict(int)
-            
-            for article in self.articles:
-                for country in article.countries:
-                    country_articles[country][article.url] = article
-                    if country in article.country_mentions:
-                        country_total_mentions[country] += article.country_mentions[country]
+                count = len(articles_dict)
+                for article in articles_dict.values():
+                    yield ('Industry', industry, count, article.title, article.url)
             
+            # Countries with mention counts
             for country, articles_dict in sorted(country_articles.items(), 
                                                   key=lambda x: country_total_mentions.get(x[0], 0), 
                                                   reverse=True):
-                articles_list = list(articles_dict.values())
-                titles = ' | '.join([a.title for a in articles_list])
-                urls = ' | '.join([a.url for a in articles_list])
                 total_mentions = country_total_mentions.get(country, 0)
-                writer.writerow([
-                    'Country',
-                    country,
-                    f"{total_mentions} mentions in {len(articles_list)} articles",
-                    titles,
-                    urls
-                ])
-            
-            # Export attack methods data - use dict with URLs to ensure each article is only added once
-            method_articles = defaultdict(dict)  # dict[method][url] = article
-            for article in self.articles:
-                method = article.attack_method or 'unknown'
-                method_articles[method][article.url] = article
+                count = f"{total_mentions} mentions in {len(articles_dict)} articles"
+                for article in articles_dict.values():
+                    yield ('Country', country, count, article.title, article.url)
             
+            # Attack methods
             for method, articles_dict in sorted(method_articles.items(), key=lambda x: len(x[1]), reverse=True):
-                articles_list = list(articles_dict.values())
-                titles = ' | '.join([a.title for a in articles_list])
-                urls = ' | '.join([a.url for a in articles_list])
-                writer.writerow([
-                    'Attack Method',
-                    method,
-                    len(articles_list),
-                    titles,
-                    urls
-                ])
-            
-            # Export timeline data (by year) - use dict with URLs to ensure each article is only added once
-            yearly_articles = defaultdict(dict)  # dict[year][url] = article
-            for article in self.articles:
-                if article.date:
-                    try:
-                        year = datetime.strptime(article.date, '%Y-%m-%d').year
-                        yearly_articles[year][article.url] = article
-                    except ValueError:
-                        continue
+                count = len(articles_dict)
+                for article in articles_dict.values():
+                    yield ('Attack Method', method, count, article.title, article.url)
             
+            # Timeline by year
             for year, articles_dict in sorted(yearly_articles.items()):
-                articles_list = list(articles_dict.values())
-                titles = ' | '.join([a.title for a in articles_list])
-                urls = ' | '.join([a.url for a in articles_list])
-                writer.writerow([
-                    'Year',
-                    str(year),
-                    len(articles_list),
-                    titles,
-                    urls
-                ])
-            
-            # Export timeline data (by month) - use dict with URLs to ensure each article is only added once
-            monthly_articles = defaultdict(dict)  # dict[month][url] = article
-            for article in self.articles:
-                if article.date:
-                    try:
-                        date_obj = datetime.strptime(article.date, '%Y-%m-%d')
-                        month_key = date_obj.strftime('%Y-%m')
-                        monthly_articles[month_key][article.url] = article
-                    except ValueError:
-                        continue
+                count = len(articles_dict)
+                for article in articles_dict.values():
+                    yield ('Year', str(year), count, article.title, article.url)
             
+            # Timeline by month
             for month, articles_dict in sorted(monthly_articles.items()):
-                articles_list = list(articles_dict.values())
-                titles = ' | '.join([a.title for a in articles_list])
-                urls = ' | '.join([a.url for a in articles_list])
-                writer.writerow([
-                    'Month',
-                    month,
-                    len(articles_list),
-                    titles,
-                    urls
-                ])
+                count = len(articles_dict)
+                for article in articles_dict.values():
+                    yield ('Month', month, count, article.title, article.url)
+        
+        # Write all rows in one call through a 1 MiB buffer
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            csv.writer(f).writerows(rows())
         
         logger.info(f"Visualization data exported to {filename}")
 
 
+def _count_industry_keywords_chunk(texts: List[str]) -> Counter:
+    """Count DataVisualizer.INDUSTRY_KEYWORDS in a chunk of texts (process pool worker; module level to be picklable)."""
+    return DataVisualizer._count_industry_keywords(texts)
+
+
 def main():
     """Main execution function."""
     logger.info("=" * 60)